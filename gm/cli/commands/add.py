@@ -4,18 +4,25 @@
 支持自动检测分支、强制本地分支或强制远程分支。
 """
 
+import os
+import time
+from contextlib import contextmanager
+from functools import partial
 from pathlib import Path
-from typing import Optional, Tuple, List
+from typing import Callable, FrozenSet, Iterator, Optional, Tuple, List, Union
 import fnmatch
 
 import click
 
 from gm.core.branch_name_mapper import BranchNameMapper
 from gm.core.config_manager import ConfigManager
+from gm.core.config_validator import ConfigValidator
+from gm.core.data_structures import GMConfig
 from gm.core.cache_manager import get_cache_manager, TTLInvalidationStrategy
 from gm.core.exceptions import (
     GitException,
     ConfigException,
+    ConfigValidationError,
     WorktreeAlreadyExists,
     TransactionRollbackError,
     GitCommandError,
@@ -28,6 +35,9 @@ from gm.cli.utils import OutputFormatter, InteractivePrompt, ProgressBar, Format
 
 logger = get_logger("add_command")
 
+# --source 取值到 AddCommand.execute(local=...) 参数的映射
+BRANCH_SOURCES = {"auto": None, "local": True, "remote": False}
+
 
 class AddCommand:
     """添加 worktree 命令处理器
@@ -35,13 +45,16 @@ class AddCommand:
     负责添加新的 worktree 并关联分支。
     """
 
-    def __init__(self, project_path: Optional[Path] = None):
+    def __init__(self, project_path: Optional[Union[str, os.PathLike]] = None):
         """初始化添加命令处理器
 
         Args:
             project_path: 项目路径，默认为自动查找
         """
-        if project_path:
+        if isinstance(project_path, Path):
+            # 已是 Path 时直接使用，避免重复构造
+            self.project_path = project_path
+        elif project_path:
             self.project_path = Path(project_path)
         else:
             # 自动从当前目录向上查找 GM 项目根目录
@@ -51,7 +64,45 @@ class AddCommand:
         self.gm_path = self.project_path / ".gm"
         self.git_client = GitClient(self.gm_path)
         self.config_manager = ConfigManager(self.project_path)
-        self.branch_mapper = None
+        # 配置文件路径由 ConfigManager 计算一次，这里直接复用
+        self._config_path = self.config_manager.config_path
+        # 读取用的配置快照，首次访问时加载（execute 中位于项目验证之后）
+        self._config_snapshot: Optional[GMConfig] = None
+        # 项目根目录的字符串形式只计算一次，worktree 等路径都由它拼接
+        self._project_path_str = os.fspath(self.project_path)
+        self._branch_mapper: Optional[BranchNameMapper] = None
+        self.dir_name: Optional[str] = None
+        self.worktree_path: Optional[Path] = None
+        self._initialized = False
+        # 各步骤耗时（毫秒），execute 结束时汇总成一条日志
+        self._trace: List[Tuple[str, float]] = []
+        # 远程分支集合，由 match_branch_pattern 加载，同一命令内复用
+        self._remote_refs_cache: Optional[FrozenSet[str]] = None
+
+    @property
+    def _config_cache(self) -> GMConfig:
+        """本次命令读取分支映射、主分支等用的配置快照，首次访问时加载"""
+        if self._config_snapshot is None:
+            self._config_snapshot = self.config_manager.load_config()
+        return self._config_snapshot
+
+    @contextmanager
+    def _step(self, name: str) -> Iterator[None]:
+        """记录一个步骤的耗时到 self._trace
+
+        Args:
+            name: 步骤名称
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._trace.append((name, round((time.perf_counter() - start) * 1000, 3)))
+
+    def _timed(self, name: str, fn: Callable[..., None], *args) -> None:
+        """在 _step 中执行 fn，供事务操作绑定使用"""
+        with self._step(name):
+            fn(*args)
 
     def validate_project_initialized(self) -> bool:
         """验证项目是否已初始化
@@ -62,27 +113,55 @@ class AddCommand:
         Raises:
             ConfigException: 如果项目未初始化
         """
-        config_file = self.project_path / "gm.yaml"
-        gm_dir = self.project_path / ".gm"
+        # 同一命令实例内只需验证一次
+        if self._initialized:
+            return True
+
+        config_file = self._config_path
+        gm_dir = self.gm_path
 
-        if not config_file.exists() or not gm_dir.exists():
+        # 直接 os.stat，缺失时由异常分支处理，避免 Path.exists() 的额外封装
+        try:
+            os.stat(config_file)
+            os.stat(gm_dir)
+        except (FileNotFoundError, NotADirectoryError):
             logger.error(f"Project not initialized. Path: {self.project_path}")
             raise ConfigException(
             "项目尚未初始化。请先运行 gm init",
             details={"config_file": str(config_file), "gm_dir": str(gm_dir)},
             )
 
-        logger.info("Project verified as initialized", path=str(self.project_path))
+        self._initialized = True
+        logger.debug("Project verified as initialized", path=self.project_path)
         return True
 
+    def validate_sparse_paths(self) -> None:
+        """校验 worktree.sparse_paths 配置
+
+        git worktree add --no-checkout 之后才会用到该配置，非法值要在此之前拒绝，
+        避免留下未检出的 worktree。
+
+        Raises:
+            ConfigValidationError: 如果 sparse_paths 不是相对路径字符串列表
+        """
+        result = ConfigValidator().validate_sparse_paths(self._config_cache.worktree.sparse_paths)
+        if not result.is_valid:
+            logger.error("Invalid worktree.sparse_paths", errors=[str(e) for e in result.errors])
+            raise ConfigValidationError(
+                "gm.yaml 中的 worktree.sparse_paths 配置无效：" + "；".join(e.message for e in result.errors),
+                details={e.field: e.message for e in result.errors},
+            )
+
     def check_branch_exists(self, branch_name: str, local: Optional[bool] = None) -> Tuple[bool, str]:
         """检查分支是否存在
 
         支持三种模式：
-        1. local=None: 自动检测（优先远程分支）
+        1. local=None: 自动检测（本地已有该分支时直接使用，否则优先远程分支）
         2. local=True: 仅检查本地分支，如果不存在允许创建
         3. local=False: 仅检查远程分支（强制要求存在）
 
+        只查询本地引用，不触发网络拉取（远程分支由 ensure_remote_fetched 拉取）。
+
         Args:
             branch_name: 分支名称
             local: 分支来源限制
@@ -93,33 +172,41 @@ class AddCommand:
         Raises:
             GitException: 仅当 remote=True 且远程分支不存在时抛出
         """
-        logger.info("Checking branch existence", branch=branch_name, local=local)
+        logger.debug("Checking branch existence", branch=branch_name, local=local)
 
-        # 检查本地分支
-        local_exists = self.git_client.check_branch_exists(branch_name)
-        logger.debug("Local branch check result", branch=branch_name, exists=local_exists)
-
-        # 检查远程分支
-        remote_exists = False
-        try:
-            remote_branches = self.git_client.get_branch_list(remote=True)
-            # 远程分支列表通常包含 "origin/" 前缀
-            remote_exists = any(
-                b == f"origin/{branch_name}" or b == branch_name
-                for b in remote_branches
+        # 指定了来源时只按名字精确查询对应引用，自动检测时一次调用同时检查两侧
+        if local is True:
+            local_exists = self.git_client.ref_exists(f"refs/heads/{branch_name}")
+            remote_exists = False
+        elif local is False:
+            local_exists = False
+            remote_exists = self.git_client.remote_ref_exists(branch_name)
+        elif self._remote_refs_cache is not None:
+            # 远程分支集合已加载（如模式匹配之后），只需再查本地分支
+            local_exists = self.git_client.ref_exists(f"refs/heads/{branch_name}")
+            remote_exists = (
+                f"origin/{branch_name}" in self._remote_refs_cache
+                or branch_name in self._remote_refs_cache
             )
-            logger.debug("Remote branch check result", branch=branch_name, exists=remote_exists)
-        except GitException as e:
-            logger.warning("Failed to check remote branches", error=str(e))
+        else:
+            refs = self.git_client.resolve_branch(branch_name)
+            local_exists = refs["local"]
+            remote_exists = refs["remote"]
+        logger.debug(
+            "Branch resolution result",
+            branch=branch_name,
+            local_exists=local_exists,
+            remote_exists=remote_exists,
+        )
 
         # 根据 local 参数返回结果
         if local is True:
             # 本地模式：如果本地分支存在就使用，否则允许创建新分支
             if local_exists:
-                logger.info("Local branch exists, will use existing branch", branch=branch_name)
+                logger.debug("Local branch exists, will use existing branch", branch=branch_name)
                 return True, "local"
             else:
-                logger.info("Local branch does not exist, will create new branch", branch=branch_name)
+                logger.debug("Local branch does not exist, will create new branch", branch=branch_name)
                 return True, "new"
 
         elif local is False:
@@ -129,28 +216,49 @@ class AddCommand:
                     f"远程分支不存在: {branch_name}",
                     details={"branch": branch_name, "type": "remote"},
                 )
-            # 如果仅指定远程，需要获取远程分支
-            self.git_client.get_remote_branch(branch_name)
+            # 远程分支的拉取推迟到 ensure_remote_fetched，在路径校验通过后执行
             return True, "remote"
 
         else:
-            # 自动检测：优先使用远程分支
-            if remote_exists:
-                logger.info(
-                    "Remote branch detected, fetching remote branch",
+            # 自动检测：两侧结果已在上方取得（resolve_branch 一次查询，或本地 show-ref 加已加载的远程分支集合）
+            # 本地分支已存在时直接使用，省去 git fetch 的网络往返；需要拉取远端请用 -r
+            if local_exists:
+                logger.debug(
+                    "Local branch detected, skipping remote fetch",
                     branch=branch_name,
+                    remote_exists=remote_exists,
                 )
-                self.git_client.get_remote_branch(branch_name)
-                return True, "remote"
-
-            if local_exists:
-                logger.info("Local branch detected", branch=branch_name)
                 return True, "local"
 
+            if remote_exists:
+                logger.debug("Remote branch detected", branch=branch_name)
+                return True, "remote"
+
             # 分支不存在：自动模式下允许创建新分支
-            logger.info("Branch not found in local or remote, will create new branch", branch=branch_name)
+            logger.debug("Branch not found in local or remote, will create new branch", branch=branch_name)
             return True, "new"
 
+    def ensure_remote_fetched(self, branch_name: str) -> None:
+        """拉取远程分支到本地（网络操作）
+
+        与 check_branch_exists 分离，仅在本地校验全部通过后调用，避免无用的 fetch。
+
+        Args:
+            branch_name: 分支名称
+
+        Raises:
+            GitCommandError: 如果拉取失败
+        """
+        logger.debug("Fetching remote branch", branch=branch_name)
+        self.git_client.get_remote_branch(branch_name)
+
+    @property
+    def branch_mapper(self) -> BranchNameMapper:
+        """分支名映射器，首次访问时按配置中的映射创建，之后复用同一实例"""
+        if self._branch_mapper is None:
+            self._branch_mapper = BranchNameMapper(self._config_cache.branch_mapping)
+        return self._branch_mapper
+
     def map_branch_to_dir(self, branch_name: str) -> str:
         """将分支名映射到目录名
 
@@ -163,13 +271,8 @@ class AddCommand:
         Raises:
             Exception: 如果映射失败
         """
-        # 初始化分支映射器（如果未初始化）
-        if self.branch_mapper is None:
-            branch_mappings = self.config_manager.get_branch_mapping()
-            self.branch_mapper = BranchNameMapper(branch_mappings)
-
         mapped_name = self.branch_mapper.map_branch_to_dir(branch_name)
-        logger.info(
+        logger.debug(
             "Branch mapped to directory",
             branch=branch_name,
             mapped_to=mapped_name,
@@ -188,12 +291,12 @@ class AddCommand:
             完整的 worktree 路径
         """
         # 主分支在根目录本身，其他分支直接在项目根目录下创建
-        if branch_name == self.config_manager.load_config().main_branch:
+        if branch_name == self._config_cache.main_branch:
             worktree_path = self.project_path
         else:
-            worktree_path = self.project_path / dir_name
+            worktree_path = Path(os.path.join(self._project_path_str, dir_name))
         
-        logger.debug("Worktree path calculated", path=str(worktree_path))
+        logger.debug("Worktree path calculated", path=worktree_path)
         
         return worktree_path
 
@@ -209,28 +312,29 @@ class AddCommand:
         Raises:
             WorktreeAlreadyExists: 如果 worktree 已存在
         """
-        if worktree_path.exists():
+        # lexists 不跟随链接，遗留的悬空链接同样视为已存在
+        if os.path.lexists(worktree_path):
             logger.error("Worktree already exists", path=str(worktree_path))
             raise WorktreeAlreadyExists(
                 f"Worktree 已存在: {worktree_path}",
                 details={"path": str(worktree_path)},
             )
 
-        logger.info("Verified worktree does not exist", path=str(worktree_path))
+        logger.debug("Verified worktree does not exist", path=worktree_path)
         return True
 
     def is_in_git_repo(self) -> bool:
         """检查当前目录是否在 git 版本库中"""
         # 检查是否存在 .git 文件或 .gm/.git 目录
-        git_file = self.project_path / ".git"
-        gm_git = self.project_path / ".gm" / ".git"
-        return git_file.exists() or gm_git.exists()
+        return (
+            os.path.exists(os.path.join(self._project_path_str, ".git"))
+            or os.path.exists(os.path.join(self._project_path_str, ".gm", ".git"))
+        )
 
     def is_gm_sibling(self) -> bool:
         """检查当前目录是否在 .gm 同级目录"""
         # 检查父目录下是否有 .gm 目录
-        gm_dir = self.project_path / ".gm"
-        return gm_dir.exists() and gm_dir.is_dir()
+        return os.path.isdir(self.gm_path)
 
     def create_worktree(self, dir_name: str, branch_name: str, local: Optional[bool] = None,
                         branch_exists: bool = False) -> None:
@@ -255,14 +359,16 @@ class AddCommand:
 
         try:
             # 在 .gm 目录执行命令
-            gm_dir = self.project_path / ".gm"
+            gm_dir = self.gm_path
+            sparse_paths = self._config_cache.worktree.sparse_paths or None
 
             if local is False:
                 # 远程分支: 检出已有远程分支
-                self.git_client.create_worktree(
+                created = self.git_client.create_worktree(
                     path=Path(worktree_path),
                     branch=branch_name,
-                    cwd=gm_dir
+                    cwd=gm_dir,
+                    sparse_paths=sparse_paths,
                 )
             elif local is True:
                 # 本地分支模式
@@ -270,35 +376,39 @@ class AddCommand:
                     # 在 git 仓库内: 创建新分支或检出已有分支
                     if branch_exists:
                         # 检出已有本地分支
-                        self.git_client.create_worktree(
+                        created = self.git_client.create_worktree(
                             path=Path(worktree_path),
                             branch=branch_name,
-                            cwd=gm_dir
+                            cwd=gm_dir,
+                            sparse_paths=sparse_paths,
                         )
                     else:
                         # 基于当前分支创建新分支
-                        self.git_client.create_worktree(
+                        created = self.git_client.create_worktree(
                             path=Path(worktree_path),
                             new_branch=branch_name,
-                            cwd=gm_dir
+                            cwd=gm_dir,
+                            sparse_paths=sparse_paths,
                         )
                 elif self.is_gm_sibling():
                     # 在 .gm 同级目录: 基于主分支创建新分支
-                    main_branch = self.config_manager.load_config().main_branch
+                    main_branch = self._config_cache.main_branch
                     if branch_exists:
                         # 检出已有本地分支
-                        self.git_client.create_worktree(
+                        created = self.git_client.create_worktree(
                             path=Path(worktree_path),
                             branch=branch_name,
-                            cwd=gm_dir
+                            cwd=gm_dir,
+                            sparse_paths=sparse_paths,
                         )
                     else:
                         # 基于主分支创建新分支
-                        self.git_client.create_worktree(
+                        created = self.git_client.create_worktree(
                             path=Path(worktree_path),
                             new_branch=branch_name,
                             base_branch=main_branch,
-                            cwd=gm_dir
+                            cwd=gm_dir,
+                            sparse_paths=sparse_paths,
                         )
                 else:
                     raise GitException(
@@ -310,11 +420,16 @@ class AddCommand:
                     "自动检测模式应该在 execute 方法中处理，不应该调用到这里"
                 )
 
-            logger.info(
+            if not created:
+                raise GitCommandError(
+                    f"创建 worktree 失败: {worktree_path}", details=f"branch={branch_name}"
+                )
+
+            logger.debug(
                 "Worktree created successfully",
                 path=worktree_path,
                 branch=branch_name,
-                cwd=str(gm_dir),
+                cwd=gm_dir,
             )
         except GitCommandError as e:
             logger.error(
@@ -342,16 +457,16 @@ class AddCommand:
                 config_manager=self.config_manager
             )
 
-            logger.info(
+            logger.debug(
                 "Setting up symlinks for worktree",
-                worktree_path=str(worktree_path),
+                worktree_path=worktree_path,
             )
 
             result = shared_file_manager.setup_shared_files(worktree_path)
 
-            logger.info(
+            logger.debug(
                 "Symlinks setup completed",
-                worktree_path=str(worktree_path),
+                worktree_path=worktree_path,
                 success=result
             )
 
@@ -374,15 +489,16 @@ class AddCommand:
             GitException: 如果获取分支列表失败
         """
         try:
-            # 获取本地分支
-            local_branches = self.git_client.get_branch_list(remote=False)
-            # 获取远程分支
-            remote_branches = self.git_client.get_branch_list(remote=True)
+            # 一次 git 调用获取本地与远程分支
+            local_branches, remote_branches = self.git_client.list_branch_refs()
+            # 远程分支集合缓存供后续 check_branch_exists 复用
+            self._remote_refs_cache = frozenset(remote_branches)
 
-            all_branches = local_branches + remote_branches
+            # 按顺序去重后匹配；fnmatch.filter 只翻译编译一次模式
+            all_branches = list(dict.fromkeys(local_branches + remote_branches))
 
             # 使用 fnmatch 进行模糊匹配
-            matched = [b for b in all_branches if fnmatch.fnmatch(b, pattern)]
+            matched = fnmatch.filter(all_branches, pattern)
 
             logger.info(
                 "Branch pattern matched",
@@ -407,8 +523,8 @@ class AddCommand:
             ConfigException: 如果配置更新失败
         """
         try:
-            # 重新加载配置（避免使用缓存的旧配置）
-            self.config_manager._config = None
+            # 重新加载配置：其间其他 add/del 写入的条目不会被快照覆盖
+            # （load_config 按 mtime/大小缓存，文件未变化时不会重新解析）
             current_config = self.config_manager.load_config()
 
             # 记录新的 worktree
@@ -427,11 +543,11 @@ class AddCommand:
             # 保存更新后的配置
             self.config_manager.save_config(current_config)
 
-            logger.info(
+            logger.debug(
                 "Configuration updated",
                 branch=branch_name,
                 dir=dir_name,
-                path=str(worktree_path),
+                path=worktree_path,
             )
 
         except ConfigException as e:
@@ -442,12 +558,17 @@ class AddCommand:
         self,
         branch_name: str,
         local: Optional[bool] = None,
-    ) -> None:
+        use_transaction: bool = True,
+    ) -> Tuple[str, Path]:
         """执行添加 worktree 命令
 
         Args:
             branch_name: 要添加的分支名
             local: 分支来源限制（None=自动，True=本地，False=远程）
+            use_transaction: 是否将创建步骤包装在事务中（失败时回滚）
+
+        Returns:
+            (dir_name, worktree_path) 元组
 
         Raises:
             ConfigException: 如果项目配置异常
@@ -455,33 +576,45 @@ class AddCommand:
             WorktreeAlreadyExists: 如果 worktree 已存在
             TransactionRollbackError: 如果事务回滚失败
         """
-        logger.info(
+        logger.debug(
             "Adding worktree",
             branch=branch_name,
-            project_path=str(self.project_path),
+            project_path=self.project_path,
             local=local,
         )
 
+        self._trace = []
+        start = time.perf_counter()
+
         try:
-            # 1. 验证项目已初始化
-            self.validate_project_initialized()
+            # 1. 验证项目已初始化，并在创建 worktree 前校验 sparse_paths 配置
+            with self._step("validate_project"):
+                self.validate_project_initialized()
+                self.validate_sparse_paths()
 
             # 2. 检查分支存在
-            branch_exists, branch_type = self.check_branch_exists(branch_name, local)
+            with self._step("check_branch"):
+                branch_exists, branch_type = self.check_branch_exists(branch_name, local)
 
             # 3. 将分支名映射为目录名
-            dir_name = self.map_branch_to_dir(branch_name)
+            with self._step("map_branch"):
+                dir_name = self.map_branch_to_dir(branch_name)
+            self.dir_name = dir_name
 
             # 4. 获取 worktree 完整路径
             worktree_path = self.get_worktree_path(dir_name, branch_name)
+            self.worktree_path = worktree_path
 
             # 5. 检查 worktree 不存在
-            self.check_worktree_not_exists(worktree_path)
+            with self._step("check_worktree"):
+                self.check_worktree_not_exists(worktree_path)
 
-            # 使用事务确保原子操作
-            tx = Transaction()
+            # 本地校验通过后才执行网络拉取
+            if branch_type == "remote":
+                with self._step("fetch_remote"):
+                    self.ensure_remote_fetched(branch_name)
 
-            # 6. 添加创建 worktree 的操作
+            # 6. 根据分支类型确定创建 worktree 的方式
             # 根据期望逻辑：远端存在→-r 流程, 本地存在→-l 流程, 否则→创建新分支
             if branch_type == "remote":
                 # 远程分支存在，按 -r 流程（检出远程分支）
@@ -500,37 +633,58 @@ class AddCommand:
                 actual_local = local
                 actual_branch_exists = branch_exists
 
-            # 使用立即绑定避免 lambda 捕获问题
-            _dir_name, _branch_name, _actual_local, _branch_exists = dir_name, branch_name, actual_local, actual_branch_exists
-            tx.add_operation(
-                execute_fn=lambda: self.create_worktree(_dir_name, _branch_name, _actual_local, _branch_exists),
-                rollback_fn=lambda: self._rollback_worktree(_dir_name),
-                description=f"Create worktree for branch {branch_name}",
-            )
+            worktree_full_path = Path(os.path.join(self._project_path_str, dir_name))
+
+            if use_transaction:
+                # 使用事务确保原子操作
+                tx = Transaction()
+
+                # 7. 添加创建 worktree 的操作
+                # partial 在此处立即绑定参数，无需闭包捕获
+                tx.add_operation(
+                    execute_fn=partial(
+                        self._timed, "create_worktree", self.create_worktree,
+                        dir_name, branch_name, actual_local, actual_branch_exists,
+                    ),
+                    rollback_fn=partial(self._rollback_worktree, dir_name),
+                    description=f"Create worktree for branch {branch_name}",
+                )
 
-            # 7. 添加创建符号链接的操作
-            worktree_full_path = self.project_path / dir_name
-            tx.add_operation(
-                execute_fn=lambda: self.setup_symlinks(worktree_full_path),
-                description=f"Setup symlinks in worktree {dir_name}",
-            )
+                # 8. 添加创建符号链接的操作
+                tx.add_operation(
+                    execute_fn=partial(self._timed, "setup_symlinks", self.setup_symlinks, worktree_full_path),
+                    description=f"Setup symlinks in worktree {dir_name}",
+                )
 
-            # 8. 添加更新配置的操作
-            tx.add_operation(
-                execute_fn=lambda: self.update_config(branch_name, dir_name, worktree_full_path),
-                description=f"Update configuration for worktree {dir_name}",
-            )
+                # 9. 添加更新配置的操作
+                tx.add_operation(
+                    execute_fn=partial(
+                        self._timed, "update_config", self.update_config,
+                        branch_name, dir_name, worktree_full_path,
+                    ),
+                    description=f"Update configuration for worktree {dir_name}",
+                )
 
-            # 9. 提交事务
-            tx.commit()
+                # 10. 提交事务
+                tx.commit()
+            else:
+                # 不使用事务时直接顺序执行，失败不回滚
+                self._execute_steps(
+                    branch_name, dir_name, worktree_full_path, actual_local, actual_branch_exists
+                )
 
+            # 中间步骤只输出 debug 日志，成功后汇总为一条记录
             logger.info(
-                "Worktree added successfully",
+                "gm add completed",
                 branch=branch_name,
                 dir=dir_name,
-                path=str(worktree_path),
+                path=worktree_path,
+                duration_ms=round((time.perf_counter() - start) * 1000, 3),
+                steps=self._trace,
             )
 
+            return dir_name, worktree_path
+
         except (ConfigException, GitException, WorktreeAlreadyExists) as e:
             logger.error("Failed to add worktree", error=str(e))
             raise
@@ -541,6 +695,30 @@ class AddCommand:
             logger.error("Unexpected error during add command", error=str(e))
             raise
 
+    def _execute_steps(
+        self,
+        branch_name: str,
+        dir_name: str,
+        worktree_path: Path,
+        local: Optional[bool],
+        branch_exists: bool,
+    ) -> None:
+        """不经事务直接执行创建 worktree、设置符号链接、更新配置三个步骤
+
+        Args:
+            branch_name: 分支名
+            dir_name: 分支文件夹名称
+            worktree_path: worktree 完整路径
+            local: 是否按本地分支流程创建
+            branch_exists: 分支是否已存在
+        """
+        with self._step("create_worktree"):
+            self.create_worktree(dir_name, branch_name, local, branch_exists)
+        with self._step("setup_symlinks"):
+            self.setup_symlinks(worktree_path)
+        with self._step("update_config"):
+            self.update_config(branch_name, dir_name, worktree_path)
+
     def _rollback_worktree(self, dir_name: str) -> None:
         """回滚 worktree 创建
 
@@ -548,7 +726,7 @@ class AddCommand:
             dir_name: 分支文件夹名称
         """
         try:
-            worktree_path = self.project_path / dir_name
+            worktree_path = Path(os.path.join(self._project_path_str, dir_name))
             self.git_client.remove_worktree(worktree_path, force=True)
             logger.info("Worktree deleted during rollback", dir=dir_name)
         except GitCommandError as e:
@@ -558,17 +736,24 @@ class AddCommand:
 
 @click.command()
 @click.argument("branch")
+@click.option(
+    "-s",
+    "--source",
+    type=click.Choice(list(BRANCH_SOURCES)),
+    default=None,
+    help="分支来源：auto 自动检测（默认），local 本地分支，remote 远程分支",
+)
 @click.option(
     "-l",
     "--local",
     is_flag=True,
-    help="强制使用本地分支",
+    help="强制使用本地分支（等同 --source local）",
 )
 @click.option(
     "-r",
     "--remote",
     is_flag=True,
-    help="强制使用远程分支",
+    help="强制使用远程分支（等同 --source remote）",
 )
 @click.option(
     "-p",
@@ -589,23 +774,31 @@ class AddCommand:
     is_flag=True,
     help="跳过确认提示",
 )
+@click.option(
+    "--no-tx",
+    is_flag=True,
+    hidden=True,
+    help="不使用事务直接执行（用于性能分析）",
+)
 @click.pass_context
 def add(
     ctx: click.Context,
     branch: str,
+    source: Optional[str],
     local: bool,
     remote: bool,
     branch_pattern: bool,
     auto_create: bool,
-    yes: bool
+    yes: bool,
+    no_tx: bool,
 ) -> None:
     """添加新的 worktree 并关联分支
 
     \b
     使用示例:
-    gm add feature/new-ui           # 自动检测分支（优先远程）
-    gm add feature/new-ui -l        # 强制使用本地分支
-    gm add feature/new-ui -r        # 强制使用远程分支
+    gm add feature/new-ui           # 自动检测分支（本地已存在则直接使用）
+    gm add feature/new-ui -s local  # 强制使用本地分支（同 -l）
+    gm add feature/new-ui -s remote # 强制使用远程分支（同 -r）
     gm add "feature/*" -p           # 使用模式匹配选择分支
     gm add feature/new-ui -r --auto-create  # 从远程创建本地分支
     """
@@ -614,18 +807,20 @@ def add(
     no_color = ctx.obj.get('no_color', False)
     formatter = OutputFormatter(FormatterConfig(no_color=no_color))
 
+    # -s/-l/-r 都用于指定分支来源，只能给出其中一个
+    given = [
+        flag
+        for flag, used in (("-s/--source", source is not None), ("-l/--local", local), ("-r/--remote", remote))
+        if used
+    ]
+    if len(given) > 1:
+        raise click.UsageError(f"{' 与 '.join(given)} 不能同时指定", ctx=ctx)
+    if source is None:
+        source = "local" if local else "remote" if remote else "auto"
+
     try:
-        # 确定分支来源
-        branch_source = None
-        if local and remote:
-            click.echo(formatter.error("不能同时指定 -l 和 -r"), err=True)
-            raise SystemExit(1)
-
-        if local:
-            branch_source = True
-        elif remote:
-            branch_source = False
-        # 否则 branch_source 保持为 None，使用自动检测
+        # 确定分支来源（None 表示自动检测）
+        branch_source = BRANCH_SOURCES[source]
 
         cmd = AddCommand()
 
@@ -668,7 +863,7 @@ def add(
 
         # 执行添加
         click.echo(formatter.info("Adding worktree..."))
-        cmd.execute(selected_branch, local=branch_source)
+        dir_name, _ = cmd.execute(selected_branch, local=branch_source, use_transaction=not no_tx)
         progress.update(1)
 
         if verbose:
@@ -687,10 +882,6 @@ def add(
 
         progress.update(1)
 
-        # 获取映射后的目录名用于输出
-        mapper = BranchNameMapper(cmd.config_manager.get_branch_mapping())
-        dir_name = mapper.map_branch_to_dir(selected_branch)
-
         click.echo()
         click.echo(formatter.success("Successfully added worktree for branch"))
         click.echo(f"  Branch: {selected_branch}")
@@ -2,6 +2,7 @@
 
 提供缓存信息查看和清理功能。"""
 
+import os
 import click
 import shutil
 from pathlib import Path
@@ -37,54 +38,71 @@ class CacheCommand:
     
     def _calculate_cache_size(self, cache_dir: Path) -> float:
         """计算缓存大小 (MB)"""
-        if not cache_dir.exists():
-            return 0.0
-        
-        total_size = 0
         try:
-            for item in cache_dir.rglob('*'):
-                if item.is_file():
-                    total_size += item.stat().st_size
+            total_size = self._walk_size(os.fspath(cache_dir))
+        except FileNotFoundError:
+            # 缓存目录不存在，直接由遍历时的异常判定，省去额外的 exists 检查
+            return 0.0
         except Exception as e:
             logger.warning("Failed to calculate cache size", error=str(e))
             return 0.0
         
         return total_size / (1024 * 1024)
     
+    @staticmethod
+    def _walk_size(root: str) -> int:
+        """用 os.scandir 栈式遍历目录，累加普通文件字节数（不跟随符号链接）"""
+        total_size = 0
+        stack = [root]
+        while stack:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        total_size += entry.stat(follow_symlinks=False).st_size
+        return total_size
+    
+    _SIZE_UNITS = ("B", "KB", "MB", "GB")
+
     def _format_size(self, size_mb: float) -> str:
-        """格式化大小显示"""
-        if size_mb < 1:
-            size_kb = size_mb * 1024
-            return f"{size_kb:.1f} KB"
-        elif size_mb < 1024:
-            return f"{size_mb:.1f} MB"
-        else:
-            size_gb = size_mb / 1024
-            return f"{size_gb:.1f} GB"
+        """格式化大小显示
+
+        按字节数的二进制位数直接算出单位档位，不足 1 KB 时以 B 显示。
+        """
+        size_bytes = int(size_mb * 1024 * 1024)
+        unit_idx = min(len(self._SIZE_UNITS) - 1, max(size_bytes.bit_length() - 1, 0) // 10)
+        if unit_idx == 0:
+            return f"{size_bytes} B"
+        return f"{size_bytes / (1 << (10 * unit_idx)):.1f} {self._SIZE_UNITS[unit_idx]}"
     
     def clear_cache(self, clear_all: bool = False) -> dict:
         """清理缓存"""
         try:
             cache_dir = self.cache_manager.cache_path
-            before_size = self._calculate_cache_size(cache_dir)
-            
-            if not cache_dir.exists():
+            if not os.path.exists(cache_dir):
                 return {'success': True, 'freed_mb': 0}
             
+            before_size = self._calculate_cache_size(cache_dir)
+            
+            expired_entries = 0
             if clear_all:
                 shutil.rmtree(cache_dir)
                 cache_dir.mkdir(parents=True, exist_ok=True)
+                # 目录已重建为空，无需再次遍历
+                after_size = 0.0
             else:
-                self.cache_manager.cleanup_expired()
-            
-            after_size = self._calculate_cache_size(cache_dir)
+                # 过期清理只作用于内存中的缓存条目，不改动缓存目录，无需再次遍历
+                expired_entries = self.cache_manager.cleanup_expired()
+                after_size = before_size
             freed_size = before_size - after_size
             
             return {
                 'success': True,
                 'before_size_mb': round(before_size, 2),
                 'after_size_mb': round(after_size, 2),
-                'freed_mb': round(freed_size, 2)
+                'freed_mb': round(freed_size, 2),
+                'expired_entries': expired_entries,
             }
         except Exception as e:
             logger.error("Failed to clear cache", error=str(e))
@@ -130,7 +148,11 @@ def cache_clear(ctx: click.Context, all: bool) -> None:
         result = cmd.clear_cache(clear_all=all)
         if result['success']:
             click.echo(formatter.success("清理完成!"))
-            click.echo(f"  释放空间: {result['freed_mb']} MB")
+            if all:
+                click.echo(f"  释放空间: {result['freed_mb']} MB")
+            else:
+                # 过期清理只移除内存中的缓存条目，不释放磁盘空间，报告条目数
+                click.echo(f"  清理过期条目: {result['expired_entries']} 个")
     except Exception as e:
         click.echo(formatter.error(f"清理失败: {str(e)}"), err=True)
         raise SystemExit(1)
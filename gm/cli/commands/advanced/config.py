@@ -3,17 +3,21 @@
 用于查看和修改项目配置。"""
 
 import click
-import yaml
+from dataclasses import asdict, is_dataclass
 from pathlib import Path
 from typing import Dict, Any, Optional
 
-from gm.core.config_manager import ConfigManager
-from gm.core.exceptions import ConfigException
+from gm.core.config_manager import ConfigManager, _load_yaml
+from gm.core.config_validator import ConfigValidator
+from gm.core.exceptions import ConfigException, ConfigValidationError
 from gm.core.logger import get_logger
 from gm.cli.utils.formatting import OutputFormatter, FormatterConfig
 
 logger = get_logger("config_command")
 
+_TRUE_VALUES = frozenset({"true", "yes", "on", "1"})
+_FALSE_VALUES = frozenset({"false", "no", "off", "0"})
+
 
 class ConfigCommand:
     """配置管理命令"""
@@ -21,14 +25,140 @@ class ConfigCommand:
     def __init__(self, project_path: Optional[Path] = None):
         self.project_path = Path(project_path) if project_path else Path.cwd()
         self.config_manager = ConfigManager(self.project_path)
+        # 点分键 -> 值 的扁平索引，首次读取时构建一次
+        self._flat: Optional[Dict[str, Any]] = None
+
+    def _flat_index(self) -> Dict[str, Any]:
+        """获取扁平配置索引（如 'symlinks.strategy'），同一进程内只解析一次配置"""
+        if self._flat is None:
+            flat: Dict[str, Any] = {}
+            stack = [("", asdict(self.config_manager.load_config()))]
+            while stack:
+                prefix, node = stack.pop()
+                for name, value in node.items():
+                    key = f"{prefix}{name}"
+                    flat[key] = value
+                    if isinstance(value, dict):
+                        stack.append((f"{key}.", value))
+            self._flat = flat
+        return self._flat
 
     def execute_get(self, key: str) -> str:
         """获取配置项"""
-        return f"Value for {key} (Mock output)"
+        flat = self._flat_index()
+        if key not in flat:
+            raise ConfigException(f"配置项不存在: {key}")
+        return self._format_value(flat[key])
 
     def execute_set(self, key: str, value: Any) -> str:
         """设置配置项"""
-        return f"Set {key} to {value} (Mock output)"
+        # 与 get 使用同一份扁平索引判断键是否存在，含点号的映射键（如 branch_mapping.v1.2）同样可设置
+        if key not in self._flat_index():
+            raise ConfigException(f"配置项不存在: {key}")
+
+        config = self.config_manager.load_config()
+        node, name = self._locate(config, key)
+        if node is None or isinstance(self._child(node, name), dict) or is_dataclass(self._child(node, name)):
+            raise ConfigException(f"配置项不存在或不可直接设置: {key}")
+
+        new_value = self._coerce_value(key, value, self._child(node, name))
+        # 先验证再写回：load_config 返回的是缓存对象，验证失败时不能留下修改
+        self._validate_value(key, new_value)
+        if isinstance(node, dict):
+            node[name] = new_value
+        else:
+            setattr(node, name, new_value)
+
+        self.config_manager.save_config(config)
+        # 嵌套结构已更新，扁平索引下次读取时重建
+        self._flat = None
+        logger.info("Config value updated", key=key)
+        return f"{key} = {self._format_value(self._flat_index()[key])}"
+
+    @staticmethod
+    def _child(node: Any, name: str) -> Any:
+        """读取配置段（dataclass）或映射字典中的子项"""
+        return node.get(name) if isinstance(node, dict) else getattr(node, name, None)
+
+    @staticmethod
+    def _locate(config: Any, key: str):
+        """沿点分键定位到直接父节点，返回 (父节点, 子项名)；找不到时父节点为 None
+
+        每一层按该层实际存在的名称匹配键的前缀，映射键本身含点号时也能定位。
+        """
+        node, rest = config, key
+        while True:
+            names = list(node) if isinstance(node, dict) else list(vars(node))
+            if rest in names:
+                return node, rest
+            for name in names:
+                child = ConfigCommand._child(node, name)
+                if rest.startswith(f"{name}.") and (isinstance(child, dict) or is_dataclass(child)):
+                    node, rest = child, rest[len(name) + 1:]
+                    break
+            else:
+                return None, rest
+
+    @staticmethod
+    def _validate_value(key: str, value: Any) -> None:
+        """保存前验证新值，不合法时抛出 ConfigValidationError"""
+        validator = ConfigValidator()
+        if key == "symlinks.strategy":
+            result = validator.validate_symlink_strategy(value)
+        elif key == "worktree.sparse_paths":
+            result = validator.validate_sparse_paths(value)
+        else:
+            result = None
+        if result is not None and not result.is_valid:
+            raise ConfigValidationError("; ".join(str(e) for e in result.errors))
+
+        # gm.yaml 由模板逐行写出、标量不加引号，写出后无法原样读回的字符串直接拒绝
+        items = value if isinstance(value, list) else [value]
+        for item in items:
+            if not isinstance(item, str) or item == "":
+                continue
+            if key.startswith("branch_mapping.") and "'" in item:
+                raise ConfigValidationError(f"{key} 的值不能包含单引号: {item}")
+            try:
+                loaded = _load_yaml(f"- {item}")
+            except Exception:
+                loaded = None
+            if loaded != [item]:
+                raise ConfigValidationError(f"{key} 的值包含 YAML 特殊字符，无法安全写入 gm.yaml: {item}")
+
+    @staticmethod
+    def _coerce_value(key: str, value: Any, current: Any) -> Any:
+        """按原值类型转换命令行传入的字符串"""
+        if not isinstance(value, str):
+            return value
+        if isinstance(current, bool):
+            lowered = value.lower()
+            if lowered in _TRUE_VALUES:
+                return True
+            if lowered in _FALSE_VALUES:
+                return False
+            raise ConfigValidationError(f"{key} 需要布尔值 (true/false)，收到: {value}")
+        if isinstance(current, int):
+            try:
+                return int(value)
+            except ValueError:
+                raise ConfigValidationError(f"{key} 需要整数，收到: {value}")
+        if isinstance(current, list):
+            return [item.strip() for item in value.split(",") if item.strip()]
+        return value
+
+    @staticmethod
+    def _format_value(value: Any) -> str:
+        """格式化输出配置值"""
+        if isinstance(value, bool):
+            return str(value).lower()
+        if value is None:
+            return "null"
+        if isinstance(value, list):
+            return ", ".join(str(item) for item in value)
+        if isinstance(value, dict):
+            return "\n".join(f"{k}: {ConfigCommand._format_value(v)}" for k, v in value.items())
+        return str(value)
 
 
 @click.group()
@@ -3,18 +3,29 @@
 克隆仓库并初始化为 .gm worktree 结构。
 """
 
+import os
+import re
 import shutil
+import stat
+import subprocess
 import sys
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from functools import partial
+from itertools import islice
 from pathlib import Path
-from typing import Optional
-from urllib.parse import urlparse
+from typing import Any, Iterator, Optional, Tuple, Type
 
 import click
 
 from gm.cli.commands.init import InitCommand
-from gm.cli.utils.project_utils import find_gm_root_optional
+from gm.cli.utils.project_utils import find_gm_root_optional, move_path, move_paths
+from gm.core.branch_name_mapper import normalize_main_branch_name
 from gm.core.config_manager import ConfigManager
 from gm.core.exceptions import (
+    GMException,
     GitException,
     ConfigException,
     TransactionRollbackError,
@@ -32,6 +43,70 @@ from gm.core.transaction import Transaction
 
 logger = get_logger("clone_command")
 
+# 仓库 URL 前缀分类，与 urlparse 的 scheme 规则一致（首字符为字母，直到第一个冒号）
+_URL_PREFIX_RE = re.compile(
+    r"(?P<ssh>git@)|(?P<windows>[^\W\d_]:)|(?P<unix>/)|(?P<scheme>[A-Za-z][A-Za-z0-9+.-]*):"
+)
+_REMOTE_SCHEMES = frozenset({"http", "https", "git"})
+
+# 目标目录非空时，日志中最多统计的条目数
+_NONEMPTY_SAMPLE = 16
+# HEAD 文件中指向本地分支的符号引用前缀
+_HEAD_REF_PREFIX = "ref: refs/heads/"
+
+
+def _stat_mode(path: Path) -> Optional[int]:
+    """返回路径的 st_mode，路径不存在时返回 None（与 Path.exists 的判定一致）"""
+    try:
+        return os.stat(path).st_mode
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def _read_head_branch(git_dir: Path) -> Optional[str]:
+    """从 git 目录的 HEAD 文件读取当前分支名
+
+    HEAD 为符号引用（ref: refs/heads/<branch>）时返回分支名；分离 HEAD、
+    文件不存在或无法读取时返回 None，由调用方回退到 git 命令。
+    """
+    try:
+        head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+    if head.startswith(_HEAD_REF_PREFIX):
+        return head[len(_HEAD_REF_PREFIX):] or None
+    return None
+
+
+@contextmanager
+def _wrap_errors(
+    event: str,
+    message: str,
+    exc_type: Type[GMException] = GitException,
+    passthrough: Tuple[Type[Exception], ...] = (GitException,),
+    passthrough_event: Optional[str] = None,
+    **context: Any,
+) -> Iterator[None]:
+    """将非预期异常记录日志并包装为 exc_type，passthrough 中的领域异常原样抛出
+
+    Args:
+        event: 包装异常时的日志事件名
+        message: 包装后异常的消息前缀
+        exc_type: 包装使用的领域异常类型
+        passthrough: 不包装、原样抛出的异常类型
+        passthrough_event: 非空时，原样抛出前也以该事件名记录错误日志
+        **context: 附加到错误日志的上下文
+    """
+    try:
+        yield
+    except passthrough as e:
+        if passthrough_event is not None:
+            logger.error(passthrough_event, error=str(e), **context)
+        raise
+    except Exception as e:
+        logger.error(event, error=str(e), **context)
+        raise exc_type(f"{message}：{e}") from e
+
 
 class CloneCommand:
     """克隆命令处理器
@@ -46,6 +121,9 @@ class CloneCommand:
         branch: Optional[str] = None,
         depth: Optional[int] = None,
         no_init: bool = False,
+        jobs: Optional[int] = None,
+        recurse_submodules: bool = False,
+        filter_spec: Optional[str] = None,
     ):
         """初始化克隆命令处理器
 
@@ -53,15 +131,26 @@ class CloneCommand:
             repo_url: 仓库 URL
             project_path: 克隆目标路径，默认使用仓库名称
             branch: 初始分支，默认为仓库默认分支
-            depth: shallow clone 的深度，默认不使用 shallow clone
+            depth: shallow clone 的深度；None 时仅克隆不初始化（且未指定 filter）默认为 1，0 表示完整历史
             no_init: 是否仅克隆不初始化，默认为 False
+            jobs: 并行拉取子模块的数量，仅在 recurse_submodules 时生效
+            recurse_submodules: 是否同时克隆子模块
+            filter_spec: partial clone 过滤规则（如 blob:none、tree:0），默认下载全部对象
         """
         self.repo_url = repo_url
         self.project_path = Path(project_path) if project_path else None
         self.branch = branch
         self.depth = depth
         self.no_init = no_init
+        self.recurse_submodules = recurse_submodules
+        # 克隆子模块且未指定并发数时，按 CPU 数并行拉取（最多 8 个）
+        if recurse_submodules and jobs is None:
+            jobs = min(8, os.cpu_count() or 1)
+        self.jobs = jobs
+        self.filter_spec = filter_spec
         self.cloned_path: Optional[Path] = None
+        # initialize_gm 开始时解析一次的仓库绝对路径，初始化各步骤共用
+        self._resolved_repo: Optional[Path] = None
 
     def validate_repo_url(self) -> bool:
         """验证仓库 URL 有效性
@@ -72,7 +161,7 @@ class CloneCommand:
         Raises:
             GitException: 如果 URL 无效
         """
-        try:
+        with _wrap_errors("Failed to validate repository URL", "验证仓库 URL 失败", url=self.repo_url):
             # 验证 URL 格式
             if not self.repo_url:
                 raise GitException("仓库 URL 不能为空")
@@ -84,36 +173,21 @@ class CloneCommand:
             # file:///path/to/repo
             # C:\path\to\repo (Windows)
 
-            parsed = urlparse(self.repo_url)
-
-            # 检查是本地路径还是远程 URL
-            # 支持 Unix 路径和 Windows 路径
-            is_unix_path = self.repo_url.startswith("/")
-            is_windows_path = (len(self.repo_url) > 1 and
-                              self.repo_url[1] == ":" and
-                              self.repo_url[0].isalpha())
-            is_file_url = parsed.scheme == "file"
-            is_no_scheme = not parsed.scheme
+            # 一次前缀匹配完成分类；未匹配到任何前缀即视为无 scheme 的本地路径
+            match = _URL_PREFIX_RE.match(self.repo_url)
+            kind = match.lastgroup if match else None
+            scheme = match.group("scheme").lower() if kind == "scheme" else ""
 
-            is_local_path = (
-                is_unix_path or is_windows_path or is_file_url or
-                (is_no_scheme and not self.repo_url.startswith("git@"))
-            )
-            is_remote_url = parsed.scheme in ("http", "https", "git")
-            is_ssh_url = self.repo_url.startswith("git@")
+            is_ssh_url = kind == "ssh"
+            is_remote_url = scheme in _REMOTE_SCHEMES
+            is_local_path = kind in (None, "unix", "windows") or scheme == "file"
 
             if not (is_local_path or is_remote_url or is_ssh_url):
                 raise GitException(f"无效的仓库 URL 格式：{self.repo_url}")
 
-            logger.info("Repository URL validated", url=self.repo_url)
+            logger.debug("Repository URL validated", url=self.repo_url)
             return True
 
-        except GitException:
-            raise
-        except Exception as e:
-            logger.error("Failed to validate repository URL", url=self.repo_url, error=str(e))
-            raise GitException(f"验证仓库 URL 失败：{str(e)}")
-
     def determine_target_path(self) -> Path:
         """确定目标路径
 
@@ -125,7 +199,7 @@ class CloneCommand:
         Raises:
             GitException: 如果无法确定目标路径
         """
-        try:
+        with _wrap_errors("Failed to determine target path", "确定目标路径失败", url=self.repo_url):
             if self.project_path:
                 return self.project_path
 
@@ -144,16 +218,10 @@ class CloneCommand:
             if not repo_name:
                 raise GitException(f"无法从 URL 提取仓库名称：{self.repo_url}")
 
-            target_path = Path.cwd() / repo_name
-            logger.info("Target path determined", url=self.repo_url, path=str(target_path))
+            target_path = Path(os.path.join(os.getcwd(), repo_name))
+            logger.debug("Target path determined", url=self.repo_url, path=target_path)
             return target_path
 
-        except GitException:
-            raise
-        except Exception as e:
-            logger.error("Failed to determine target path", url=self.repo_url, error=str(e))
-            raise GitException(f"确定目标路径失败：{str(e)}")
-
     def validate_target_path(self, target_path: Path) -> bool:
         """验证目标路径有效性
 
@@ -163,32 +231,38 @@ class CloneCommand:
         Raises:
             GitException: 如果路径已存在且非空，或已是 GM 项目
         """
-        try:
-            if target_path.exists():
-                # 检查目录是否为空
-                if target_path.is_dir():
-                    items = list(target_path.iterdir())
-                    if items:
-                        logger.error(
-                            "Target path is not empty",
-                            path=str(target_path),
-                            items_count=len(items),
-                        )
-                        raise GitException(
-                            f"目标路径已存在且不为空：{target_path}"
-                        )
-                else:
-                    logger.error("Target path exists and is not a directory", path=str(target_path))
+        with _wrap_errors("Failed to validate target path", "验证目标路径失败", path=target_path):
+            target_mode = _stat_mode(target_path)
+            if target_mode is not None:
+                if not stat.S_ISDIR(target_mode):
+                    logger.error("Target path exists and is not a directory", path=target_path)
                     raise GitException(
                         f"目标路径存在但不是目录：{target_path}"
                     )
-
-            # 验证父目录是否可写
-            parent_dir = target_path.parent
-            if not parent_dir.exists():
-                logger.warning("Parent directory does not exist, will be created", path=str(parent_dir))
-            elif not parent_dir.is_dir():
-                raise GitException(f"父目录不是目录：{parent_dir}")
+                # 只需判断是否为空；非空时最多再读 _NONEMPTY_SAMPLE 个条目用于日志
+                with os.scandir(target_path) as it:
+                    first = next(it, None)
+                    if first is not None:
+                        items_count = 1 + sum(1 for _ in islice(it, _NONEMPTY_SAMPLE - 1))
+                if first is not None:
+                    logger.error(
+                        "Target path is not empty",
+                        path=target_path,
+                        first_entry=first.name,
+                        items_count=items_count,
+                        truncated=items_count >= _NONEMPTY_SAMPLE,
+                    )
+                    raise GitException(
+                        f"目标路径已存在且不为空：{target_path}"
+                    )
+            else:
+                # 目标已存在时父目录必然是目录，只有目标不存在时才需要检查父目录
+                parent_dir = target_path.parent
+                parent_mode = _stat_mode(parent_dir)
+                if parent_mode is None:
+                    logger.warning("Parent directory does not exist, will be created", path=parent_dir)
+                elif not stat.S_ISDIR(parent_mode):
+                    raise GitException(f"父目录不是目录：{parent_dir}")
 
             # 检查目标路径或其父目录是否已是 GM 项目
             existing_root = find_gm_root_optional(target_path)
@@ -198,15 +272,9 @@ class CloneCommand:
                     f"提示: 请选择一个非 GM 项目的目录进行克隆"
                 )
 
-            logger.info("Target path validated", path=str(target_path))
+            logger.debug("Target path validated", path=target_path)
             return True
 
-        except GitException:
-            raise
-        except Exception as e:
-            logger.error("Failed to validate target path", path=str(target_path), error=str(e))
-            raise GitException(f"验证目标路径失败：{str(e)}")
-
     def clone_repository(self, target_path: Path) -> None:
         """克隆 Git 仓库
 
@@ -216,65 +284,85 @@ class CloneCommand:
         Raises:
             GitCommandError: 克隆失败时抛出
         """
-        try:
+        with _wrap_errors(
+            "Unexpected error during cloning",
+            "克隆失败",
+            GitCommandError,
+            passthrough=(GitCommandError,),
+            passthrough_event="Failed to clone repository",
+            url=self.repo_url,
+        ):
             # 确保父目录存在
             target_path.parent.mkdir(parents=True, exist_ok=True)
 
             # 构建 git clone 命令
             cmd = ["git", "clone"]
 
-            if self.depth:
-                cmd.extend(["--depth", str(self.depth)])
+            depth = self.depth
+            if depth is None and self.no_init and not self.filter_spec:
+                # 仅克隆不初始化时多用于快照/扫描，默认只拉取最新提交
+                depth = 1
+                logger.debug("Defaulting to shallow clone for --no-init", depth=depth)
+            if depth:
+                cmd.extend(["--depth", str(depth)])
+
+            if self.filter_spec:
+                cmd.extend(["--filter", self.filter_spec])
 
             if self.branch:
                 cmd.extend(["--branch", self.branch])
+                # 仅克隆不初始化时只会用到这一个分支，不再协商和下载其他分支的引用与对象；
+                # 初始化为 GM 项目时保留全部远程分支，供 gm add 检测远程分支使用
+                if self.no_init:
+                    cmd.append("--single-branch")
+
+            if self.recurse_submodules:
+                cmd.append("--recurse-submodules")
+                if self.jobs:
+                    # --jobs 作用于本次克隆；submodule.fetchJobs 写入新仓库配置，
+                    # 之后的 fetch/submodule update 也按同样的并发拉取
+                    cmd.extend([f"--jobs={self.jobs}", "-c", f"submodule.fetchJobs={self.jobs}"])
+
+            # 仅在终端交互时显示进度，重定向到文件/管道时保持安静
+            if sys.stderr.isatty():
+                cmd.append("--progress")
 
             cmd.extend([self.repo_url, str(target_path)])
 
-            # 使用 GitClient 执行命令
+            # clone 输出量随仓库规模增长，流式转发而不是整体捕获
             git_client = GitClient()
-            git_client.run_command(cmd)
+            git_client.stream_command(cmd)
 
             self.cloned_path = target_path
-            logger.info(
+            logger.debug(
                 "Repository cloned successfully",
                 url=self.repo_url,
-                path=str(target_path),
+                path=target_path,
                 branch=self.branch,
             )
 
-        except GitCommandError as e:
-            logger.error("Failed to clone repository", url=self.repo_url, error=str(e))
-            raise
-        except Exception as e:
-            logger.error("Unexpected error during cloning", url=self.repo_url, error=str(e))
-            raise GitCommandError(f"克隆失败：{str(e)}") from e
-
     def _convert_to_bare_and_move_git(self, repo_path: Path) -> None:
         """移动 .git 目录到 .gm/.git，然后生成 .git 文件指向 .gm/.git
 
         Args:
             repo_path: 仓库路径
         """
-        import shutil
-        
         git_src = repo_path / ".git"
         gm_git_dst = repo_path / ".gm" / ".git"
         git_file = repo_path / ".git"
         
         if git_src.exists() and not gm_git_dst.exists():
             # 1. 移动 .git 目录到 .gm/.git
-            shutil.move(str(git_src), str(gm_git_dst))
+            move_path(git_src, gm_git_dst)
             
             # 2. 生成 .git 文件，指向 .gm/.git（使用绝对路径）
-            absolute_git_path = repo_path.resolve() / ".gm" / ".git"
-            git_file_content = f"gitdir: {absolute_git_path}"
-            with open(git_file, 'w', encoding='utf-8') as f:
-                f.write(git_file_content)
+            absolute_git_path = os.path.join(self._resolved_repo or repo_path.resolve(), ".gm", ".git")
+            # 直接写字节：不经过文本层的编码器和换行转换
+            git_file.write_bytes(f"gitdir: {absolute_git_path}".encode("utf-8"))
             
-            logger.info("Git directory moved and .git file created with absolute path", 
-                       src=str(git_src), dst=str(gm_git_dst), git_file=str(git_file), 
-                       git_target=str(absolute_git_path))
+            logger.debug("Git directory moved and .git file created with absolute path", 
+                       src=git_src, dst=gm_git_dst, git_file=git_file, 
+                       git_target=absolute_git_path)
 
     def _create_worktree_directory(self, repo_path: Path, branch: str) -> None:
         """创建主分支对应的 worktree 目录
@@ -285,7 +373,7 @@ class CloneCommand:
         """
         worktree_dir = repo_path / branch
         worktree_dir.mkdir(parents=True, exist_ok=True)
-        logger.info("Created worktree directory", path=str(worktree_dir), branch=branch)
+        logger.debug("Created worktree directory", path=worktree_dir, branch=branch)
 
     def _move_working_files(self, repo_path: Path, branch: str) -> None:
         """将工作区文件移到 worktree 目录
@@ -294,43 +382,44 @@ class CloneCommand:
             repo_path: 仓库路径
             branch: 分支名称
         """
-        import shutil
-        import os
-
         worktree_dir = repo_path / branch
         gm_dir = repo_path / ".gm"
         gm_yaml = repo_path / "gm.yaml"
 
         # 需要忽略的文件/目录
         # 注意：根目录的.git文件(指向.gm/.git的gitdir文件)会被移动到分支文件夹
-        ignore_items = {".gm", "gm.yaml", branch}
+        ignore_items = frozenset({".gm", "gm.yaml", branch})
 
-        # 移动普通文件和目录到分支目录
-        for item in os.listdir(repo_path):
-            if item not in ignore_items:
-                src = repo_path / item
-                dst = worktree_dir / item
+        # 单次 scandir 收集待移动条目（先收集再移动，避免边遍历边修改目录）
+        with os.scandir(repo_path) as it:
+            entries = [entry for entry in it if entry.name not in ignore_items]
 
-                if src.is_dir():
-                    shutil.move(str(src), str(dst))
-                else:
-                    shutil.move(str(src), str(dst))
+        # 移动普通文件和目录到分支目录（文件与目录同样处理，条目较多时并行移动）
+        pairs = [(entry.path, os.path.join(worktree_dir, entry.name)) for entry in entries]
+        move_paths(pairs)
+        for src, dst in pairs:
+            logger.debug("Moved item to worktree", src=src, dst=dst)
 
-                logger.info("Moved item to worktree", item=item, src=str(src), dst=str(dst))
+        logger.debug("Moved working files to worktree", branch=branch, count=len(entries))
 
         # 注意：根目录的.git文件已经在 _convert_to_bare_and_move_git 中生成
         # 并在上面的循环中被移动到分支文件夹，所以这里不需要再创建
 
-    def _create_complete_config(self, repo_path: Path, use_local: bool, main_branch: str) -> None:
+    def _create_complete_config(
+        self,
+        repo_path: Path,
+        use_local: bool,
+        main_branch: str,
+        original_branch: Optional[str] = None,
+    ) -> None:
         """创建包含完整项目信息的配置文件
 
         Args:
             repo_path: 仓库路径
             use_local: 是否使用本地分支
             main_branch: 主分支名称
+            original_branch: 规范化前的原始分支名，已知时不再调用 git 查询
         """
-        from gm.core.config_manager import ConfigManager
-        
         # 创建配置管理器
         config_manager = ConfigManager(repo_path)
         
@@ -344,16 +433,18 @@ class CloneCommand:
         
         # 设置项目信息
         config.project_name = repo_path.name
-        config.home_path = str(repo_path.resolve())
+        config.home_path = str(self._resolved_repo or repo_path.resolve())
         config.remote_url = self.repo_url
         
         # 设置分支映射（原始分支名 -> 规范化的文件夹名）
         try:
-            # GitClient 应该在 .gm 目录执行命令（GM 项目的 git 仓库在 .gm/.git）
-            gm_path = repo_path / ".gm"
-            git_client = GitClient(gm_path)
-            original_branch = git_client.get_current_branch() or main_branch
-            config.branch_mapping[original_branch] = main_branch
+            # 调用方已查询过当前分支时直接复用；否则在 .gm 目录查询（仓库在 .gm/.git）
+            if original_branch is None:
+                gm_path = repo_path / ".gm"
+                original_branch = (
+                    _read_head_branch(gm_path / ".git") or GitClient(gm_path).get_current_branch()
+                )
+            config.branch_mapping[original_branch or main_branch] = main_branch
         except Exception:
             # 如果获取原始分支失败，只设置规范化后的分支名
             config.branch_mapping[main_branch] = main_branch
@@ -361,7 +452,7 @@ class CloneCommand:
         # 保存配置
         config_manager.save_config(config)
         
-        logger.info("Complete configuration created", 
+        logger.debug("Complete configuration created", 
                    project_name=config.project_name,
                    home_path=config.home_path,
                    remote_url=config.remote_url,
@@ -376,14 +467,7 @@ class CloneCommand:
         Returns:
             规范化后的分支名称
         """
-        import re
-        # 将特殊符号替换为短横线
-        normalized = re.sub(r'[^a-zA-Z0-9_-]', '-', branch_name)
-        # 将连续的短横线替换为单个短横线
-        normalized = re.sub(r'-+', '-', normalized)
-        # 移除开头和结尾的短横线
-        normalized = normalized.strip('-')
-        return normalized
+        return normalize_main_branch_name(branch_name)
 
     def initialize_gm(self, repo_path: Path) -> None:
         """初始化为 .gm 结构
@@ -394,7 +478,16 @@ class CloneCommand:
         Raises:
             ConfigException: 初始化失败时抛出
         """
-        try:
+        with _wrap_errors(
+            "Failed to initialize GM project",
+            "初始化失败",
+            ConfigException,
+            passthrough=(ConfigException,),
+            path=repo_path,
+        ):
+            # 仓库路径在整个初始化事务中不变，只解析一次
+            self._resolved_repo = repo_path.resolve()
+
             # 创建 InitCommand 实例
             init_cmd = InitCommand(repo_path)
 
@@ -411,7 +504,10 @@ class CloneCommand:
             use_local = True
             main_branch: str = "main"  # 默认值
             try:
-                current_branch = init_cmd.git_client.get_current_branch()
+                # 刚克隆的仓库 .git 是普通目录，直接读 HEAD 文件，无需启动 git 进程
+                current_branch = (
+                    _read_head_branch(repo_path / ".git") or init_cmd.git_client.get_current_branch()
+                )
                 main_branch = current_branch or "main"
             except Exception:
                 main_branch = "main"
@@ -431,46 +527,43 @@ class CloneCommand:
                 )
 
                 tx.add_operation(
-                    execute_fn=lambda: self._convert_to_bare_and_move_git(repo_path),
+                    execute_fn=partial(self._convert_to_bare_and_move_git, repo_path),
                     description="Convert to bare and move .git to .gm/.git",
                 )
 
                 tx.add_operation(
-                    execute_fn=lambda: self._create_complete_config(repo_path, use_local, normalized_main_branch),
+                    execute_fn=partial(
+                        self._create_complete_config,
+                        repo_path, use_local, normalized_main_branch, main_branch,
+                    ),
                     rollback_fn=init_cmd._rollback_config,
-    description="Create gm.yaml configuration with complete project info",
+                    description="Create gm.yaml configuration with complete project info",
                 )
 
                 tx.add_operation(
-                    execute_fn=lambda: self._create_worktree_directory(repo_path, normalized_main_branch),
+                    execute_fn=partial(self._create_worktree_directory, repo_path, normalized_main_branch),
                     description="Create worktree directory",
                 )
 
                 tx.add_operation(
-                    execute_fn=lambda: self._move_working_files(repo_path, normalized_main_branch),
+                    execute_fn=partial(self._move_working_files, repo_path, normalized_main_branch),
                     description="Move working files to worktree",
                 )
 
                 tx.add_operation(
-                    execute_fn=lambda: init_cmd.setup_shared_files(main_branch),
+                    execute_fn=partial(init_cmd.setup_shared_files, main_branch),
                     description="Setup shared files",
                 )
 
                 # 提交事务
                 tx.commit()
 
-                logger.info("Repository initialized as GM project", path=str(repo_path))
+                logger.debug("Repository initialized as GM project", path=repo_path)
 
             except TransactionRollbackError as e:
                 logger.error("Failed to initialize GM project, transaction rolled back", error=str(e))
                 raise ConfigException(f"初始化失败并已回滚：{str(e)}")
 
-        except ConfigException:
-            raise
-        except Exception as e:
-            logger.error("Failed to initialize GM project", path=str(repo_path), error=str(e))
-            raise ConfigException(f"初始化失败：{str(e)}") from e
-
     def cleanup_on_failure(self, target_path: Path) -> None:
         """在失败时清理克隆的仓库
 
@@ -479,11 +572,60 @@ class CloneCommand:
         """
         try:
             if target_path.exists():
-                logger.info("Cleaning up cloned repository", path=str(target_path))
-                shutil.rmtree(target_path)
-                logger.info("Cloned repository removed", path=str(target_path))
+                logger.info("Cleaning up cloned repository", path=target_path)
+                # 先原子改名让出目标路径，再在后台删除，失败信息无需等待整棵树删完即可返回
+                trash_path = target_path.with_name(
+                    f"{target_path.name}.gm-trash-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+                )
+                try:
+                    os.rename(target_path, trash_path)
+                except OSError:
+                    trash_path = None
+                if trash_path is not None:
+                    self._remove_in_background(trash_path)
+                elif not self._rm_rf(target_path):
+                    shutil.rmtree(target_path)
+                logger.info("Cloned repository removed", path=target_path, trash=trash_path)
         except Exception as e:
-            logger.error("Failed to cleanup cloned repository", path=str(target_path), error=str(e))
+            logger.error("Failed to cleanup cloned repository", path=target_path, error=str(e))
+
+    def _remove_in_background(self, trash_path: Path) -> None:
+        """后台删除已改名的目录树
+
+        POSIX 下启动独立会话的 rm -rf，CLI 可以立即退出；否则在非守护线程中 rmtree，
+        进程退出前会等待其完成。
+        """
+        if os.name == "posix" and shutil.which("rm") is not None:
+            try:
+                subprocess.Popen(
+                    ["rm", "-rf", "--", os.fspath(trash_path)],
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    start_new_session=True,
+                )
+                return
+            except OSError:
+                pass
+        threading.Thread(
+            target=shutil.rmtree,
+            args=(trash_path,),
+            kwargs={"ignore_errors": True},
+            daemon=False,
+        ).start()
+
+    @staticmethod
+    def _rm_rf(target_path: Path) -> bool:
+        """POSIX 下调用 rm -rf 删除目录树，不可用或失败时返回 False 以回退到 shutil.rmtree"""
+        if os.name != "posix" or shutil.which("rm") is None:
+            return False
+        try:
+            result = subprocess.run(
+                ["rm", "-rf", "--", os.fspath(target_path)], capture_output=True, check=False
+            )
+        except OSError:
+            return False
+        return result.returncode == 0 and not os.path.lexists(target_path)
 
     def execute(self) -> Path:
         """执行克隆和初始化
@@ -495,9 +637,14 @@ class CloneCommand:
             GitException: 如果 git 操作失败
             ConfigException: 如果配置操作失败
         """
-        logger.info("Starting clone operation", url=self.repo_url, no_init=self.no_init)
-
-        try:
+        logger.debug("Starting clone operation", url=self.repo_url, no_init=self.no_init)
+        start = time.perf_counter()
+
+        with _wrap_errors(
+            "Unexpected error during clone operation",
+            "克隆失败",
+            passthrough=(GitException, ConfigException),
+        ):
             # 1. 验证仓库 URL
             self.validate_repo_url()
 
@@ -520,19 +667,16 @@ class CloneCommand:
                     self.cleanup_on_failure(target_path)
                     raise
 
+            # 中间步骤只输出 debug 日志，成功后汇总为一条记录
             logger.info(
                 "Clone operation completed successfully",
                 url=self.repo_url,
-                path=str(target_path),
+                path=target_path,
+                no_init=self.no_init,
+                duration_ms=round((time.perf_counter() - start) * 1000, 3),
             )
             return target_path
 
-        except (GitException, ConfigException):
-            raise
-        except Exception as e:
-            logger.error("Unexpected error during clone operation", error=str(e))
-            raise GitException(f"克隆失败：{str(e)}") from e
-
 
 @click.command()
 @click.argument("repo_url")
@@ -546,9 +690,16 @@ class CloneCommand:
 )
 @click.option(
     "--depth",
-    type=int,
+    type=click.IntRange(min=0),
+    default=None,
+    help="使用 shallow clone 的深度（--no-init 时默认为 1，0 表示完整历史）",
+)
+@click.option(
+    "--filter",
+    "filter_spec",
+    type=str,
     default=None,
-    help="使用 shallow clone 的深度",
+    help="partial clone 过滤规则，如 blob:none（按需下载文件内容）或 tree:0",
 )
 @click.option(
     "--no-init",
@@ -556,12 +707,28 @@ class CloneCommand:
     default=False,
     help="仅克隆，不初始化为 .gm 结构",
 )
+@click.option(
+    "--recurse-submodules",
+    is_flag=True,
+    default=False,
+    help="同时克隆子模块",
+)
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=None,
+    help="并行拉取子模块的数量（默认 min(8, CPU 数)）",
+)
 def clone(
     repo_url: str,
     project_path: Optional[str],
     branch: Optional[str],
     depth: Optional[int],
+    filter_spec: Optional[str],
     no_init: bool,
+    recurse_submodules: bool,
+    jobs: Optional[int],
 ) -> None:
     """克隆仓库并初始化为 .gm worktree 结构
 
@@ -571,6 +738,8 @@ def clone(
     gm clone https://github.com/user/repo.git /path/to/project
     gm clone https://github.com/user/repo.git -b develop
     gm clone https://github.com/user/repo.git --no-init
+    gm clone https://github.com/user/repo.git --no-init --filter=blob:none
+    gm clone https://github.com/user/repo.git --recurse-submodules -j 4
     """
     try:
         cmd = CloneCommand(
@@ -579,40 +748,50 @@ def clone(
             branch=branch,
             depth=depth,
             no_init=no_init,
+            filter_spec=filter_spec,
+            jobs=jobs,
+            recurse_submodules=recurse_submodules,
         )
 
         cloned_path = cmd.execute()
 
-        click.echo(f"[OK] 仓库已从以下位置克隆：{repo_url}")
-        click.echo(f"[OK] 位置：{cloned_path}")
-
+        # 汇总输出行，一次写出
+        lines = [
+            f"[OK] 仓库已从以下位置克隆：{repo_url}",
+            f"[OK] 位置：{cloned_path}",
+        ]
         if not no_init:
-            click.echo(f"[OK] 已初始化为 GM 项目")
-            click.echo(f"[OK] .gm/ 目录已创建")
-            click.echo(f"[OK] gm.yaml 配置文件已生成")
-            click.echo(f"[OK] 准备使用 gm add [BRANCH] 添加 worktree")
+            lines.extend([
+                "[OK] 已初始化为 GM 项目",
+                "[OK] .gm/ 目录已创建",
+                "[OK] gm.yaml 配置文件已生成",
+                "[OK] 准备使用 gm add [BRANCH] 添加 worktree",
+            ])
         else:
-            click.echo(f"[OK] Clone only, not initialized")
+            lines.append("[OK] Clone only, not initialized")
+        click.echo("\n".join(lines))
 
     except GitCommandError as e:
-        click.echo(f"\nClone failed", err=True)
-        click.echo(f"Reason: {e.message}", err=True)
-        click.echo(f"\nTroubleshooting suggestions:", err=True)
-        click.echo(f"  1. Check network connection: ping github.com", err=True)
-        click.echo(f"  2. Verify URL is correct: {repo_url}", err=True)
-        click.echo(f"  3. Try using SSH instead of HTTPS", err=True)
-        click.echo(f"  4. If problem persists, try re-running the command", err=True)
+        click.echo("\n".join([
+            "\nClone failed",
+            f"Reason: {e.message}",
+            "\nTroubleshooting suggestions:",
+            "  1. Check network connection: ping github.com",
+            f"  2. Verify URL is correct: {repo_url}",
+            "  3. Try using SSH instead of HTTPS",
+            "  4. If problem persists, try re-running the command",
+        ]), err=True)
         sys.exit(1)
     except GitException as e:
-        click.echo(f"\nGit operation failed", err=True)
-        click.echo(f"Reason: {e.message}", err=True)
+        click.echo(f"\nGit operation failed\nReason: {e.message}", err=True)
         sys.exit(1)
     except ConfigException as e:
-        click.echo(f"\nConfiguration error", err=True)
-        click.echo(f"Reason: {e.message}", err=True)
+        click.echo(f"\nConfiguration error\nReason: {e.message}", err=True)
         sys.exit(1)
     except Exception as e:
-        click.echo(f"\nUnknown error occurred", err=True)
-        click.echo(f"Reason: {str(e)}", err=True)
-        click.echo(f"\nIf problem persists, please check logs for details", err=True)
+        click.echo("\n".join([
+            "\nUnknown error occurred",
+            f"Reason: {str(e)}",
+            "\nIf problem persists, please check logs for details",
+        ]), err=True)
         sys.exit(1)
@@ -4,7 +4,8 @@
 支持事务管理确保操作原子性。
 """
 
-import shutil
+import os
+import threading
 from pathlib import Path
 from typing import Optional
 
@@ -12,6 +13,7 @@ import click
 
 from gm.core.branch_name_mapper import BranchNameMapper
 from gm.core.config_manager import ConfigManager
+from gm.core.data_structures import GMConfig
 from gm.core.exceptions import (
     GitException,
     ConfigException,
@@ -22,7 +24,7 @@ from gm.core.exceptions import (
 from gm.core.git_client import GitClient
 from gm.core.logger import get_logger
 from gm.core.transaction import Transaction
-from gm.cli.utils import OutputFormatter, InteractivePrompt, FormatterConfig, find_gm_root
+from gm.cli.utils import OutputFormatter, InteractivePrompt, FormatterConfig, find_gm_root, remove_tree
 
 logger = get_logger("del_command")
 
@@ -51,6 +53,12 @@ class DelCommand:
         self.config_manager = ConfigManager(self.project_path)
         self.branch_mapper = None
         self.worktree_path = None
+        # initialize_mapper 加载的配置，本次删除流程中复用
+        self._config: Optional[GMConfig] = None
+        # 后台执行的远程分支删除（git push --delete），在 execute 结束前等待
+        self._remote_push: Optional[threading.Thread] = None
+        # 远程分支删除结果：未请求时为 None，完成后为 True/False
+        self.remote_deleted: Optional[bool] = None
 
     def validate_project_initialized(self) -> bool:
         """验证项目已初始化
@@ -61,10 +69,14 @@ class DelCommand:
         Raises:
             ConfigException: 如果项目未初始化
         """
-        config_file = self.project_path / "gm.yaml"
-        gm_dir = self.project_path / ".gm"
-
-        if not config_file.exists() and not gm_dir.exists():
+        # 任一存在即视为已初始化；先查 .gm（find_gm_root 找到的项目必有），常见情况只需一次 stat
+        for marker in (self.gm_path, self.project_path / "gm.yaml"):
+            try:
+                os.stat(marker)
+                break
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+        else:
             logger.error("Project not initialized", path=str(self.project_path))
             raise ConfigException(
                 "项目未初始化。请先运行 gm init 命令初始化项目。"
@@ -81,6 +93,7 @@ class DelCommand:
         """
         try:
             config = self.config_manager.load_config()
+            self._config = config
             branch_mapping = config.branch_mapping if config.branch_mapping else {}
 
             self.branch_mapper = BranchNameMapper(custom_mappings=branch_mapping)
@@ -106,7 +119,7 @@ class DelCommand:
             self.initialize_mapper()
 
         worktree_dir_name = self.branch_mapper.map_branch_to_dir(branch_name)
-        gm_base_path = self.project_path / self.config_manager.load_config().worktree.base_path
+        gm_base_path = self.project_path / self._config.worktree.base_path
         self.worktree_path = gm_base_path / worktree_dir_name
 
         exists = self.worktree_path.exists()
@@ -148,26 +161,17 @@ class DelCommand:
         Args:
             worktree_path: worktree 路径
             force: 是否强制删除
-
-        Raises:
-            GitCommandError: 删除失败时抛出
         """
-        try:
-            # 使用 git worktree remove 删除 worktree
-            self.git_client.remove_worktree(worktree_path, force=force)
+        # 使用 git worktree remove 删除 worktree；remove_worktree 失败时返回 False 而不抛异常
+        if self.git_client.remove_worktree(worktree_path, force=force):
             logger.info("Worktree deleted via git", path=str(worktree_path), force=force)
+            # git 已删除整个目录，无需再检查
+            return
 
-        except GitCommandError as e:
-            # 如果是非真实 worktree（比如在测试中），直接删除目录
-            logger.debug(
-                "Git worktree remove failed, attempting direct deletion",
-                path=str(worktree_path),
-                error=str(e),
-            )
-
-        # 删除 worktree 目录（无论是否成功通过 git worktree remove）
+        # 如果是非真实 worktree（比如在测试中），直接删除目录
+        logger.debug("Git worktree remove failed, attempting direct deletion", path=str(worktree_path))
         if worktree_path.exists():
-            shutil.rmtree(worktree_path)
+            remove_tree(worktree_path)
             logger.info("Worktree directory removed", path=str(worktree_path))
 
     def delete_branch(self, branch_name: str, delete_remote: bool = False) -> bool:
@@ -194,23 +198,33 @@ class DelCommand:
                 error=str(e),
             )
 
-        # 删除远程分支
+        # 删除远程分支：网络往返放到后台线程，与后续的配置更新重叠执行
         if delete_remote:
-            try:
-                self.git_client.run_command(
-                    ["git", "push", "origin", f"--delete", branch_name],
-                    check=False,
-                )
-                logger.info("Remote branch deleted", branch=branch_name)
-            except GitCommandError as e:
-                logger.warning(
-                    "Failed to delete remote branch",
-                    branch=branch_name,
-                    error=str(e),
-                )
+            self._remote_push = threading.Thread(
+                target=self._delete_remote_branch,
+                args=(branch_name,),
+                name="gm-del-push",
+            )
+            self._remote_push.start()
 
         return success
 
+    def _delete_remote_branch(self, branch_name: str) -> None:
+        """执行 git push origin --delete，结果记录在 remote_deleted，失败仅记录警告"""
+        try:
+            self.git_client.run_command(["git", "push", "origin", "--delete", branch_name])
+            self.remote_deleted = True
+            logger.info("Remote branch deleted", branch=branch_name)
+        except GitCommandError as e:
+            self.remote_deleted = False
+            logger.warning("Failed to delete remote branch", branch=branch_name, error=str(e))
+
+    def wait_remote_push(self) -> None:
+        """等待后台的远程分支删除完成"""
+        if self._remote_push is not None:
+            self._remote_push.join()
+            self._remote_push = None
+
     def cleanup_symlinks(self, worktree_path: Path) -> None:
         """清理符号链接
 
@@ -220,25 +234,41 @@ class DelCommand:
             worktree_path: worktree 路径
         """
         try:
-            # 获取 worktree 的绝对路径
-            worktree_abs_path = worktree_path.resolve()
+            # project_path 来自 find_gm_root，已是真实绝对路径，abspath 规范化即可；
+            # 真实路径仅在有链接字面不匹配时才解析
+            worktree_abs = os.path.abspath(worktree_path)
+            worktree_prefix = worktree_abs + os.sep
+            worktree_real = None
 
             # 扫描项目根目录和 .gm 目录，查找指向此 worktree 的符号链接
             search_dirs = [self.project_path, self.project_path / ".gm"]
 
             for search_dir in search_dirs:
-                if not search_dir.exists():
+                try:
+                    it = os.scandir(search_dir)
+                except (FileNotFoundError, NotADirectoryError):
                     continue
 
-                for item in search_dir.iterdir():
-                    if item.is_symlink():
+                with it:
+                    # DirEntry.is_symlink() 直接使用目录项类型，普通文件和目录无需 stat
+                    for entry in it:
+                        if not entry.is_symlink():
+                            continue
                         try:
-                            target = item.resolve()
-                            if target == worktree_abs_path or target.parent == worktree_abs_path:
-                                item.unlink()
-                                logger.info("Symlink removed", path=str(item))
+                            target = os.readlink(entry.path)
+                            target = os.path.normpath(os.path.join(search_dir, target))
+                            # 指向 worktree 本身或其中任意路径的链接，删除后都会悬空
+                            if target != worktree_abs and not target.startswith(worktree_prefix):
+                                # 字面路径不匹配时（链接经过其他符号链接）再解析真实路径
+                                if worktree_real is None:
+                                    worktree_real = os.path.realpath(worktree_abs)
+                                target = os.path.realpath(entry.path)
+                                if target != worktree_real and not target.startswith(worktree_real + os.sep):
+                                    continue
+                            os.unlink(entry.path)
+                            logger.info("Symlink removed", path=entry.path)
                         except (OSError, ValueError):
-                            logger.debug("Failed to check/remove symlink", path=str(item))
+                            logger.debug("Failed to check/remove symlink", path=entry.path)
 
             logger.info("Symlinks cleanup completed", worktree=str(worktree_path))
 
@@ -272,6 +302,7 @@ class DelCommand:
         branch_name: str,
         force: bool = False,
         delete_branch: bool = False,
+        delete_remote: bool = False,
     ) -> None:
         """执行删除命令
 
@@ -279,6 +310,7 @@ class DelCommand:
             branch_name: 分支名称
             force: 是否强制删除（忽略未提交改动）
             delete_branch: 是否删除 Git 分支
+            delete_remote: 是否同时删除远程分支（需配合 delete_branch）
 
         Raises:
             ConfigException: 如果项目未初始化
@@ -291,6 +323,7 @@ class DelCommand:
             branch=branch_name,
             force=force,
             delete_branch=delete_branch,
+            delete_remote=delete_remote,
         )
 
         # 1. 验证项目已初始化
@@ -339,7 +372,7 @@ class DelCommand:
             # 7. 可选：添加删除分支的操作
             if delete_branch:
                 tx.add_operation(
-                    execute_fn=lambda: self.delete_branch(branch_name, delete_remote=True),
+                    execute_fn=lambda: self.delete_branch(branch_name, delete_remote=delete_remote),
                     description=f"Delete branch {branch_name}",
                 )
 
@@ -364,6 +397,8 @@ class DelCommand:
         except Exception as e:
             logger.error("Delete command failed", error=str(e))
             raise
+        finally:
+            self.wait_remote_push()
 
 
 @click.command()
@@ -452,6 +487,7 @@ def del_cmd(
             branch_name=branch,
             force=force,
             delete_branch=delete_branch,
+            delete_remote=delete_remote_flag,
         )
 
         if verbose:
@@ -464,7 +500,10 @@ def del_cmd(
         if delete_branch:
             click.echo(formatter.success("分支已删除（本地）"))
             if prune_remote:
-                click.echo(formatter.success("分支已删除（远程）"))
+                if cmd.remote_deleted:
+                    click.echo(formatter.success("分支已删除（远程）"))
+                else:
+                    click.echo(formatter.warning("远程分支删除失败，请手动执行 git push origin --delete"))
         else:
             click.echo(formatter.info("分支已保留"))
 
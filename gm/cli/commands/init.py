@@ -3,12 +3,13 @@
 初始化项目为 .gm worktree 结构，创建配置文件和目录结构。"""
 
 import os
-import re
 import shutil
+from functools import partial
 from pathlib import Path
 from typing import Optional
 import click
 
+from gm.core.branch_name_mapper import normalize_main_branch_name
 from gm.core.config_manager import ConfigManager
 from gm.core.exceptions import GitException, ConfigException
 from gm.core.git_client import GitClient
@@ -16,10 +17,13 @@ from gm.core.logger import get_logger
 from gm.core.transaction import Transaction
 from gm.core.data_structures import GMConfig
 from gm.cli.utils.formatting import OutputFormatter
-from gm.cli.utils.project_utils import find_gm_root_optional
+from gm.cli.utils.project_utils import find_gm_root_optional, move_path, move_paths
 
 logger = get_logger("init_command")
 
+# .gm 下需要预先创建的子目录
+_GM_SUBDIRS = ("worktrees", "logs")
+
 
 class InitCommand:
     """项目初始化命令处理器"""
@@ -72,13 +76,25 @@ class InitCommand:
         """创建 .gm 目录结构"""
         gm_dir = self.project_path / ".gm"
         gm_dir.mkdir(exist_ok=True)
-        (gm_dir / "worktrees").mkdir(exist_ok=True)
-        (gm_dir / "logs").mkdir(exist_ok=True)
+        if os.mkdir in os.supports_dir_fd:
+            # 打开 .gm 目录一次，子目录相对该 fd 创建，避免每次重新解析完整路径
+            flags = os.O_RDONLY | getattr(os, "O_DIRECTORY", 0) | getattr(os, "O_CLOEXEC", 0)
+            dir_fd = os.open(gm_dir, flags)
+            try:
+                for name in _GM_SUBDIRS:
+                    try:
+                        os.mkdir(name, dir_fd=dir_fd)
+                    except FileExistsError:
+                        pass
+            finally:
+                os.close(dir_fd)
+        else:
+            for name in _GM_SUBDIRS:
+                (gm_dir / name).mkdir(exist_ok=True)
         logger.info("Directory structure created")
 
     def _rollback_directory(self) -> None:
         """回滚目录创建"""
-        import shutil
         gm_dir = self.project_path / ".gm"
         if gm_dir.exists():
             shutil.rmtree(gm_dir)
@@ -102,13 +118,7 @@ class InitCommand:
         Returns:
             规范化后的分支名称
         """
-        # 将特殊符号替换为短横线
-        normalized = re.sub(r'[^a-zA-Z0-9_-]', '-', branch_name)
-        # 将连续的短横线替换为单个短横线
-        normalized = re.sub(r'-+', '-', normalized)
-        # 移除开头和结尾的短横线
-        normalized = normalized.strip('-')
-        return normalized
+        return normalize_main_branch_name(branch_name)
 
     def _convert_to_bare_and_move_git(self) -> None:
         """移动 .git 目录到 .gm/.git，然后生成 .git 文件指向 .gm/.git
@@ -119,17 +129,16 @@ class InitCommand:
 
         if git_src.exists() and not gm_git_dst.exists():
             # 1. 移动 .git 目录到 .gm/.git
-            shutil.move(str(git_src), str(gm_git_dst))
+            move_path(git_src, gm_git_dst)
 
             # 2. 生成 .git 文件，指向 .gm/.git（使用绝对路径）
-            absolute_git_path = self.project_path.resolve() / ".gm" / ".git"
-            git_file_content = f"gitdir: {absolute_git_path}"
-            with open(git_file, 'w', encoding='utf-8') as f:
-                f.write(git_file_content)
+            absolute_git_path = os.path.join(self.project_path.resolve(), ".gm", ".git")
+            # 直接写字节：不经过文本层的编码器和换行转换
+            git_file.write_bytes(f"gitdir: {absolute_git_path}".encode("utf-8"))
 
             logger.info("Git directory moved and .git file created with absolute path",
                        src=str(git_src), dst=str(gm_git_dst), git_file=str(git_file),
-                       git_target=str(absolute_git_path))
+                       git_target=absolute_git_path)
 
     def _create_worktree_directory(self, branch: str) -> None:
         """创建主分支对应的 worktree 目录
@@ -151,26 +160,27 @@ class InitCommand:
 
         # 需要忽略的文件/目录
         # 注意：根目录的.git文件(指向.gm/.git的gitdir文件)会被移动到分支文件夹
-        ignore_items = {".gm", "gm.yaml", branch}
+        ignore_items = frozenset({".gm", "gm.yaml", branch})
 
-        # 移动普通文件和目录到分支目录
-        for item in os.listdir(self.project_path):
-            if item not in ignore_items:
-                src = self.project_path / item
-                dst = worktree_dir / item
+        # 单次 scandir 收集待移动条目（先收集再移动，避免边遍历边修改目录）
+        with os.scandir(self.project_path) as it:
+            entries = [entry for entry in it if entry.name not in ignore_items]
 
-                if src.is_dir():
-                    shutil.move(str(src), str(dst))
-                else:
-                    shutil.move(str(src), str(dst))
+        # 移动普通文件和目录到分支目录（文件与目录同样处理，条目较多时并行移动）
+        pairs = [(entry.path, os.path.join(worktree_dir, entry.name)) for entry in entries]
+        move_paths(pairs)
+        for src, dst in pairs:
+            logger.debug("Moved item to worktree", src=src, dst=dst)
 
-                logger.info("Moved item to worktree", item=item, src=str(src), dst=str(dst))
+        # 逐项只记 debug，移动完成后汇总一条
+        logger.info("Moved working files to worktree", branch=branch, count=len(entries))
 
-    def _create_complete_config(self, main_branch: str) -> None:
+    def _create_complete_config(self, main_branch: str, original_branch: Optional[str] = None) -> None:
         """创建包含完整项目信息的配置文件
 
         Args:
             main_branch: 主分支名称
+            original_branch: 规范化前的原始分支名，已知时不再调用 git 查询
         """
         # 加载默认配置
         config = self.config_manager.get_default_config()
@@ -202,11 +212,11 @@ class InitCommand:
 
         # 设置分支映射（原始分支名 -> 规范化的文件夹名）
         try:
-            # GitClient 应该在 .gm 目录执行命令（GM 项目的 git 仓库在 .gm/.git）
-            gm_path = self.project_path / ".gm"
-            git_client = GitClient(gm_path)
-            original_branch = git_client.get_current_branch() or main_branch
-            config.branch_mapping[original_branch] = main_branch
+            # 调用方已查询过当前分支时直接复用；否则在 .gm 目录查询（仓库在 .gm/.git）
+            if original_branch is None:
+                gm_path = self.project_path / ".gm"
+                original_branch = GitClient(gm_path).get_current_branch()
+            config.branch_mapping[original_branch or main_branch] = main_branch
         except Exception:
             # 如果获取原始分支失败，只设置规范化后的分支名
             config.branch_mapping[main_branch] = main_branch
@@ -230,15 +240,17 @@ class InitCommand:
         if current_working_dir != repo_root:
             try:
                 relative_path = current_working_dir.relative_to(repo_root)
-                click.echo("✗ 无法在子目录中执行 gm init")
-                click.echo(f"  当前位置: {relative_path}")
+                lines = ["✗ 无法在子目录中执行 gm init", f"  当前位置: {relative_path}"]
             except ValueError:
-                click.echo("✗ 当前工作目录不在 Git 仓库中")
-            click.echo(f"  仓库根目录: {repo_root}")
-            click.echo("")
-            click.echo("请切换到仓库根目录后重新执行:")
-            click.echo(f"  cd {repo_root}")
-            click.echo("  gm init")
+                lines = ["✗ 当前工作目录不在 Git 仓库中"]
+            lines.extend([
+                f"  仓库根目录: {repo_root}",
+                "",
+                "请切换到仓库根目录后重新执行:",
+                f"  cd {repo_root}",
+                "  gm init",
+            ])
+            click.echo("\n".join(lines))
             return
 
         is_initialized, existing_root = self.check_already_initialized()
@@ -246,9 +258,11 @@ class InitCommand:
             if existing_root == self.project_path:
                 click.echo("✓ 当前目录已经是 GM 项目。")
             else:
-                click.echo("✗ 无法初始化：当前目录或其父目录已是 GM 项目")
-                click.echo(f"  已存在的 GM 项目路径: {existing_root}")
-                click.echo("  提示: 使用 'gm add <分支名>' 在当前 GM 项目中添加 worktree")
+                click.echo("\n".join([
+                    "✗ 无法初始化：当前目录或其父目录已是 GM 项目",
+                    f"  已存在的 GM 项目路径: {existing_root}",
+                    "  提示: 使用 'gm add <分支名>' 在当前 GM 项目中添加 worktree",
+                ]))
             return
 
         # 获取当前分支作为主分支
@@ -280,29 +294,31 @@ class InitCommand:
                 description="移动 .git 到 .gm/.git 并创建 .git 文件"
             )
             tx.add_operation(
-                execute_fn=lambda: self._create_complete_config(normalized_main_branch),
+                execute_fn=partial(self._create_complete_config, normalized_main_branch, main_branch),
                 rollback_fn=self._rollback_config,
                 description="创建完整的 gm.yaml 配置"
             )
             tx.add_operation(
-                execute_fn=lambda: self._create_worktree_directory(normalized_main_branch),
+                execute_fn=partial(self._create_worktree_directory, normalized_main_branch),
                 description="创建 worktree 目录"
             )
             tx.add_operation(
-                execute_fn=lambda: self._move_working_files(normalized_main_branch),
+                execute_fn=partial(self._move_working_files, normalized_main_branch),
                 description="移动工作区文件到 worktree 目录"
             )
             tx.add_operation(
-                execute_fn=lambda: self.setup_shared_files(normalized_main_branch),
+                execute_fn=partial(self.setup_shared_files, normalized_main_branch),
                 description="设置共享文件"
             )
 
             tx.commit()
-            click.echo("项目初始化成功！已转换为 GM 结构")
-            click.echo(f"  - 主分支: {normalized_main_branch}")
-            click.echo(f"  - 工作区已移动到: {normalized_main_branch}/")
-            click.echo("  - Git 目录已移动到: .gm/.git/")
-            click.echo("  - 现在可以使用 'gm add <分支名>' 添加更多 worktree")
+            click.echo("\n".join([
+                "项目初始化成功！已转换为 GM 结构",
+                f"  - 主分支: {normalized_main_branch}",
+                f"  - 工作区已移动到: {normalized_main_branch}/",
+                "  - Git 目录已移动到: .gm/.git/",
+                "  - 现在可以使用 'gm add <分支名>' 添加更多 worktree",
+            ]))
         else:
             # 新目录：简单初始化
             tx.add_operation(
@@ -311,16 +327,18 @@ class InitCommand:
                 description="创建 .gm 目录结构"
             )
             tx.add_operation(
-                execute_fn=lambda: self.config_manager.save_config(GMConfig(initialized=True)),
+                execute_fn=partial(self.config_manager.save_config, GMConfig(initialized=True)),
                 rollback_fn=self._rollback_config,
                 description="生成 gm.yaml 配置文件"
             )
 
             tx.commit()
-            click.echo("项目初始化成功！已生成 gm.yaml")
-            click.echo("  - 这是一个新的 GM 项目目录")
-            click.echo("  - 请先使用 'git init' 和 'git remote add' 设置 Git 仓库")
-            click.echo("  - 然后使用 'gm add <分支名>' 添加 worktree")
+            click.echo("\n".join([
+                "项目初始化成功！已生成 gm.yaml",
+                "  - 这是一个新的 GM 项目目录",
+                "  - 请先使用 'git init' 和 'git remote add' 设置 Git 仓库",
+                "  - 然后使用 'gm add <分支名>' 添加 worktree",
+            ]))
 
 
 @click.command(name="init")
@@ -49,22 +49,50 @@ import sys
 import importlib
 import click
 
-from gm.cli.commands.init import init_cmd
-from gm.cli.commands.add import add
-from gm.cli.commands.clone import clone
-from gm.cli.commands.status import status
-from gm.cli.commands.list import list_command
-
-# 导入 del 命令（del 是保留字，使用 importlib）
-_del_module = importlib.import_module("gm.cli.commands.del")
-del_cmd = _del_module.del_cmd
-
-# 导入高级命令
-from gm.cli.commands.advanced import config, symlink, cache
 from gm.cli.utils import GMNotFoundError
 
 
-@click.group()
+class LazyGroup(click.Group):
+    """按需导入子命令的命令组
+
+    子命令以 "模块路径:属性名" 登记，仅在实际调用（或列出帮助）时才导入对应模块，
+    运行单个命令时不再加载其余命令的依赖。
+    """
+
+    def __init__(self, *args, lazy_subcommands=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        # 命令名 -> "模块路径:属性名"
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_subcommands:
+            self.add_command(self._load_command(cmd_name), name=cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _load_command(self, cmd_name):
+        # del 是保留字，无法用 import 语句导入，统一走 importlib
+        module_name, attr = self.lazy_subcommands.pop(cmd_name).split(":")
+        return getattr(importlib.import_module(module_name), attr)
+
+
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "init": "gm.cli.commands.init:init_cmd",
+        "add": "gm.cli.commands.add:add",
+        "clone": "gm.cli.commands.clone:clone",
+        "del": "gm.cli.commands.del:del_cmd",
+        "status": "gm.cli.commands.status:status",
+        "list": "gm.cli.commands.list:list_command",
+        # 高级命令
+        "config": "gm.cli.commands.advanced.config:config",
+        "symlink": "gm.cli.commands.advanced.symlink:symlink",
+        "cache": "gm.cli.commands.advanced.cache:cache",
+    },
+)
 @click.version_option(version="0.1.0")
 @click.option(
     '--verbose', 
@@ -114,20 +142,6 @@ def cli(ctx, verbose, no_color):
     ctx.obj['formatter_config'] = {'no_color': no_color}
 
 
-# 注册命令
-cli.add_command(init_cmd, name="init")
-cli.add_command(add)
-cli.add_command(clone)
-cli.add_command(del_cmd, name="del")
-cli.add_command(status)
-cli.add_command(list_command, name="list")
-
-# 注册高级命令
-cli.add_command(config)
-cli.add_command(symlink)
-cli.add_command(cache)
-
-
 def main():
     """CLI 入口点，处理全局异常"""
     try:
@@ -9,7 +9,7 @@ from .formatting import (
     Color
 )
 from .interactive import InteractivePrompt
-from .project_utils import find_gm_root, find_gm_root_optional, GMNotFoundError
+from .project_utils import find_gm_root, find_gm_root_optional, GMNotFoundError, move_path, move_paths, remove_tree
 
 __all__ = [
     'OutputFormatter',
@@ -22,4 +22,7 @@ __all__ = [
     'find_gm_root',
     'find_gm_root_optional',
     'GMNotFoundError',
+    'move_path',
+    'move_paths',
+    'remove_tree',
 ]
@@ -3,8 +3,22 @@
 提供类似 git 的目录查找机制，从当前目录逐级向上查找 GM 项目根目录。
 """
 
+import errno
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Sequence, Tuple, Union
+
+# 待移动条目达到该数量时才启用线程池并行移动
+PARALLEL_MOVE_THRESHOLD = 8
+
+# 目录树条目数（文件+目录）达到该数量时才启用线程池并行 unlink，否则直接 shutil.rmtree
+PARALLEL_UNLINK_THRESHOLD = 2048
+
+# 并行删除目录树时每个任务 unlink 的文件数
+_UNLINK_BATCH_SIZE = 256
 
 
 class GMNotFoundError(Exception):
@@ -27,24 +41,39 @@ def find_gm_root(start_path: Optional[Path] = None) -> Path:
     特殊处理：如果当前目录就是 .gm 目录，返回其父目录作为项目根。
     
     类似 git 的行为：
+    - 未指定起始目录且设置了 GM_ROOT 环境变量（类似 GIT_DIR）时，直接使用该目录
     - 从当前目录开始向上查找
     - 查找 .gm 目录
     - 验证 .gm/.git 存在
     - 返回找到的项目根目录
     
+    同一进程内按起始目录缓存查找结果，未找到时不缓存。
+    
     Args:
         start_path: 起始查找目录，默认为当前工作目录
         
     Returns:
-        GM 项目根目录路径
+        GM 项目根目录的绝对路径（向上查找时已解析符号链接）
         
     Raises:
         GMNotFoundError: 如果未找到有效的 GM 项目
     """
     if start_path is None:
-        start_path = Path.cwd()
+        env_root = os.environ.get("GM_ROOT")
+        if env_root and os.path.exists(os.path.join(env_root, ".gm", ".git")):
+            return Path(os.path.abspath(env_root))
+        # getcwd 返回的已是不含符号链接的真实路径，无需再 resolve
+        current = Path(os.getcwd())
+    else:
+        current = start_path.resolve()
     
-    current = start_path.resolve()
+    return _find_gm_root_from(current)
+
+
+@lru_cache(maxsize=32)
+def _find_gm_root_from(start: Path) -> Path:
+    """从已解析的绝对路径向上查找 GM 项目根目录（结果按起始目录缓存）"""
+    current = start
     
     # 特殊处理：如果当前目录就是 .gm 目录，直接返回其父目录
     if current.name == ".gm" and current.is_dir():
@@ -62,10 +91,10 @@ def find_gm_root(start_path: Optional[Path] = None) -> Path:
         if gm_dir.is_dir() and gm_git.exists():
             return current
         
-        # 到达根目录仍未找到
+        # 到达根目录仍未找到（异常不会被 lru_cache 缓存）
         parent = current.parent
         if parent == current:
-            raise GMNotFoundError(start_path)
+            raise GMNotFoundError(start)
         
         current = parent
 
@@ -85,3 +114,99 @@ def find_gm_root_optional(start_path: Optional[Path] = None) -> Optional[Path]:
         return find_gm_root(start_path)
     except GMNotFoundError:
         return None
+
+
+def move_path(src: Union[str, os.PathLike], dst: Union[str, os.PathLike]) -> None:
+    """在项目内移动文件或目录
+
+    GM 结构转换时源和目标都在项目目录下，通常位于同一文件系统，直接 os.replace 一次
+    rename 即可；仅在跨设备（如 .gm 是挂载点）时回退到 shutil.move 的复制+删除。
+
+    Args:
+        src: 源路径
+        dst: 目标路径（不能是已存在的目录）
+    """
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(os.fspath(src), os.fspath(dst))
+
+
+def move_paths(pairs: Sequence[Tuple[str, str]]) -> None:
+    """批量移动 (source, target)，数量较多时并行执行
+
+    各条目的 rename 互不依赖，在网络文件系统或慢盘上并行可以重叠每次调用的等待时间。
+
+    Args:
+        pairs: (源路径, 目标路径) 列表
+    """
+    if len(pairs) < PARALLEL_MOVE_THRESHOLD:
+        for source, target in pairs:
+            move_path(source, target)
+        return
+
+    workers = min(8, os.cpu_count() or 1, len(pairs))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # 消费 map 结果，使任一移动失败时异常向上抛出
+        list(executor.map(lambda pair: move_path(*pair), pairs))
+
+
+def _scan_into(directory: str, files: List[str], dirs: List[str], stack: List[str]) -> None:
+    """列出一个目录：子目录记入 dirs 并压栈待遍历，其余条目（含符号链接）记入 files"""
+    with os.scandir(directory) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                dirs.append(entry.path)
+                stack.append(entry.path)
+            else:
+                files.append(entry.path)
+
+
+def _unlink_batch(batch: Sequence[str]) -> None:
+    for path in batch:
+        os.unlink(path)
+
+
+def remove_tree(path: Union[str, os.PathLike], workers: int = 8) -> None:
+    """删除目录树，条目很多时并行 unlink
+
+    用 os.scandir 遍历，条目数未达到 PARALLEL_UNLINK_THRESHOLD 就遍历完时，说明是小目录树，
+    直接交给 shutil.rmtree；达到阈值后继续遍历收集全部文件（含符号链接）和目录，文件按批提交
+    到线程池删除，再在主线程中按子目录在前的顺序 rmdir。非 POSIX 平台直接用 shutil.rmtree。
+
+    Args:
+        path: 要删除的目录
+        workers: 最大线程数
+    """
+    root = os.fspath(path)
+    if os.name != "posix":
+        shutil.rmtree(root)
+        return
+
+    files: List[str] = []
+    dirs = [root]
+    stack = [root]
+    while stack:
+        _scan_into(stack.pop(), files, dirs, stack)
+        if len(files) + len(dirs) >= PARALLEL_UNLINK_THRESHOLD:
+            break
+    else:
+        # 未达到阈值就遍历完：小目录树，串行删除即可
+        shutil.rmtree(root)
+        return
+
+    # 大目录树：从中断处继续遍历，收集剩余的文件和目录
+    while stack:
+        _scan_into(stack.pop(), files, dirs, stack)
+
+    batches = [files[i:i + _UNLINK_BATCH_SIZE] for i in range(0, len(files), _UNLINK_BATCH_SIZE)]
+    if batches:
+        with ThreadPoolExecutor(max_workers=min(workers, os.cpu_count() or 1, len(batches))) as executor:
+            # 消费 map 结果，使任一删除失败时异常向上抛出
+            list(executor.map(_unlink_batch, batches))
+
+    # dirs 按先父后子的顺序收集，逆序即可保证子目录先于父目录删除
+    for directory in reversed(dirs):
+        os.rmdir(directory)
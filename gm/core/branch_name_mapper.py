@@ -4,12 +4,19 @@
 支持规范化映射、自定义映射及其持久化。"""
 
 import re
+from functools import lru_cache
 from typing import Dict, Optional, List, Any
 from gm.core.logger import get_logger
 from gm.core.exceptions import InvalidMappingError
 
 logger = get_logger("branch_mapper")
 
+# 预编译的规范化正则（模块级缓存，所有映射器实例共享）
+_INVALID_CHARS_RE = re.compile(r'[^a-zA-Z0-9-]')
+_DASH_RUN_RE = re.compile(r'-+')
+# 主分支目录名规范化使用的正则（保留下划线），init 与 clone 共用
+_MAIN_BRANCH_INVALID_RE = re.compile(r'[^a-zA-Z0-9_-]')
+
 
 class BranchNameMapper:
     """分支名与目录名映射管理类"""
@@ -45,16 +52,8 @@ class BranchNameMapper:
         if branch_name in self.custom_mappings:
             return self.custom_mappings[branch_name]
 
-        # 2. 默认规范化逻辑
-        result = branch_name
-        for char, replacement in self.DEFAULT_CHAR_MAPPINGS.items():
-            result = result.replace(char, replacement)
-
-        # 3. 移除非法字符（仅保留字母数字和中划线）
-        result = re.sub(r'[^a-zA-Z0-9-]', '-', result)
-
-        # 4. 压缩连续的中划线
-        result = re.sub(r'-+', '-', result).strip('-')
+        # 2. 默认规范化逻辑（纯函数，结果按分支名缓存）
+        result = _normalize_branch_name(branch_name)
 
         if not result:
             logger.warning(f"Branch name '{branch_name}' resulted in an empty directory name.")
@@ -98,3 +97,23 @@ class BranchNameMapper:
     def get_all_mapped_branches(self) -> List[str]:
         """获取所有有自定义映射的分支列表"""
         return list(self.custom_mappings.keys())
+
+
+# 默认字符转换表，单次 translate 代替逐字符 replace
+_CHAR_TABLE = str.maketrans(BranchNameMapper.DEFAULT_CHAR_MAPPINGS)
+
+
+@lru_cache(maxsize=1024)
+def _normalize_branch_name(branch_name: str) -> str:
+    """按默认规则规范化分支名，批量映射同名分支时直接命中缓存"""
+    result = branch_name.translate(_CHAR_TABLE)
+    # 移除非法字符（仅保留字母数字和中划线）
+    result = _INVALID_CHARS_RE.sub('-', result)
+    # 压缩连续的中划线
+    return _DASH_RUN_RE.sub('-', result).strip('-')
+
+
+def normalize_main_branch_name(branch_name: str) -> str:
+    """规范化主分支目录名：特殊符号替换为短横线并合并连续短横线，保留下划线，移除首尾短横线"""
+    normalized = _MAIN_BRANCH_INVALID_RE.sub('-', branch_name)
+    return _DASH_RUN_RE.sub('-', normalized).strip('-')
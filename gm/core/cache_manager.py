@@ -145,14 +145,20 @@ class LRUCacheManager(Generic[T]):
                 return False
             return True
 
-    def _evict_invalid_entries(self) -> None:
-        """驱逐所有由于策略失效的条目"""
+    def cleanup_expired(self) -> int:
+        """清理失效条目，返回清理的条目数"""
+        with self._lock:
+            return self._evict_invalid_entries()
+
+    def _evict_invalid_entries(self) -> int:
+        """驱逐所有由于策略失效的条目，返回驱逐数量"""
         invalid_keys = [
             key for key, entry in self._cache.items()
             if not entry.is_valid()
         ]
         for key in invalid_keys:
             del self._cache[key]
+        return len(invalid_keys)
 
     def _evict_lru(self) -> None:
         """根据访问频率和时间驱逐最不常用的条目"""
@@ -208,6 +214,11 @@ class CacheManager:
                 return None
             return self._caches[cache_name].get(key)
 
+    def cleanup_expired(self) -> int:
+        """清理所有命名缓存中的失效条目，返回清理的条目总数"""
+        with self._lock:
+            return sum(cache.cleanup_expired() for cache in self._caches.values())
+
 
 _global_cache_manager: Optional[CacheManager] = None
 
@@ -2,9 +2,9 @@
 
 提供 gm.yaml 配置文件的加载、验证和保存功能，实现 IConfigManager 接口。"""
 
-import yaml
+import os
 from pathlib import Path
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
 
 from gm.core.exceptions import ConfigIOError, ConfigParseError, ConfigValidationError
 from gm.core.logger import get_logger
@@ -13,6 +13,27 @@ from gm.core.interfaces.config import IConfigManager
 
 logger = get_logger("config_manager")
 
+# 纯 Python 解析器回退的提示每个进程只输出一次
+_yaml_fallback_warned = False
+
+
+def _load_yaml(stream) -> Any:
+    """解析 YAML 文本
+
+    yaml 在首次解析时才导入，不读取配置的命令（如 --help）无需承担其导入开销；
+    优先使用 libyaml 的 C 实现，未编译 libyaml 时回退到纯 Python 实现。
+    """
+    global _yaml_fallback_warned
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", None)
+    if loader is None:
+        if not _yaml_fallback_warned:
+            _yaml_fallback_warned = True
+            logger.warning("PyYAML built without libyaml, falling back to pure-Python SafeLoader")
+        loader = yaml.SafeLoader
+    return yaml.load(stream, Loader=loader)
+
 
 class ConfigManager(IConfigManager):
     """配置管理器实现"""
@@ -23,6 +44,10 @@ class ConfigManager(IConfigManager):
         # 使用 gm.yaml 作为项目级配置文件，以与你要求统一
         self.config_file = project_root / 'gm.yaml'
         self._config: Optional[GMConfig] = None
+        # 缓存对应的配置文件 (st_mtime_ns, st_size)，文件不存在时为 None
+        self._config_stamp: Optional[Tuple[int, int]] = None
+        # 与缓存对应的配置文件原文，用于判断保存时内容是否真的变化
+        self._config_text: Optional[str] = None
         logger.info("ConfigManager initialized", project_root=str(self.project_root))
     
     @property
@@ -30,32 +55,86 @@ class ConfigManager(IConfigManager):
         """获取配置路径"""
         return self.config_file
 
+    def _stat_config(self) -> Optional[Tuple[int, int]]:
+        """返回配置文件的 (st_mtime_ns, st_size)，文件不存在时返回 None"""
+        try:
+            st = os.stat(self.config_file)
+        except FileNotFoundError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
     def load_config(self) -> GMConfig:
-        """加载配置"""
-        if self._config is not None:
+        """加载配置
+
+        已解析的配置按文件的 mtime 与大小缓存，文件未变化时直接返回缓存。
+        """
+        stamp = self._stat_config()
+        if self._config is not None and stamp == self._config_stamp:
             return self._config
         
-        if not self.config_file.exists():
+        if stamp is None:
             self._config = GMConfig()
+            self._config_stamp = None
+            self._config_text = None
             return self._config
         
         try:
             with open(self.config_file, 'r', encoding='utf-8') as f:
-                config_data = yaml.safe_load(f) or {}
-            self._config = self._parse_config(config_data)
+                text = f.read()
+            self._config = self._parse_config(_load_yaml(text) or {})
+            self._config_stamp = stamp
+            self._config_text = text
             return self._config
         except Exception as e:
             logger.error(f"Failed to load config: {e}")
             raise ConfigIOError(f"Failed to load config: {e}")
 
     def save_config(self, config: GMConfig) -> None:
-        """保存配置"""
+        """保存配置
+
+        先写入同目录临时文件并 fsync，再用 os.replace 原子替换 gm.yaml，
+        其他进程不会读到写了一半的文件；内容与磁盘上一致时跳过写入。
+        gm.yaml 是符号链接时替换其指向的文件，并保留原文件的权限位。
+        """
         try:
-            self.config_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                f.write(self._generate_yaml_with_comments(config))
+            text = self._generate_yaml_with_comments(config)
+            if (
+                self._config_text == text
+                and self._config_stamp is not None
+                and self._stat_config() == self._config_stamp
+            ):
+                self._config = config
+                return
+
+            target = Path(os.path.realpath(self.config_file))
+            target.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                mode = os.stat(target).st_mode & 0o7777
+            except FileNotFoundError:
+                mode = None
+            tmp_file = target.with_name(f"{target.name}.tmp-{os.getpid()}")
+            try:
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    f.write(text)
+                    f.flush()
+                    os.fsync(f.fileno())
+                if mode is not None:
+                    os.chmod(tmp_file, mode)
+                os.replace(tmp_file, target)
+            except BaseException:
+                try:
+                    os.unlink(tmp_file)
+                except FileNotFoundError:
+                    pass
+                raise
             self._config = config
+            self._config_stamp = self._stat_config()
+            self._config_text = text
         except Exception as e:
+            # 调用方可能已修改了 load_config 返回的缓存对象，保存失败后不能再当作磁盘内容返回
+            self._config = None
+            self._config_stamp = None
+            self._config_text = None
             raise ConfigIOError(f"Failed to save config: {e}")
 
     def get_section(self, section: str) -> Dict[str, Any]:
@@ -108,6 +187,8 @@ class ConfigManager(IConfigManager):
                 config.worktree.naming_pattern = wt["naming_pattern"]
             if "auto_cleanup" in wt:
                 config.worktree.auto_cleanup = wt["auto_cleanup"]
+            if "sparse_paths" in wt:
+                config.worktree.sparse_paths = wt["sparse_paths"] or []
         # 解析 display 配置
         if "display" in data:
             disp = data["display"]
@@ -212,6 +293,16 @@ class ConfigManager(IConfigManager):
         lines.append("  # false: 保留目录，仅移除 worktree 链接")
         lines.append(f"  auto_cleanup: {str(config.worktree.auto_cleanup).lower()}")
         lines.append("")
+        lines.append("  # 稀疏检出目录列表 (git sparse-checkout cone 模式，需要 git 2.35+)")
+        lines.append("  # 为空: 新 worktree 完整检出所有文件")
+        lines.append("  # 非空: 只检出根目录文件和列出的目录，大仓库可显著减少检出量")
+        if config.worktree.sparse_paths:
+            lines.append("  sparse_paths:")
+            for path in config.worktree.sparse_paths:
+                lines.append(f"    - {path}")
+        else:
+            lines.append("  sparse_paths: []")
+        lines.append("")
 
         # 显示配置部分
         lines.append("# ==========================================")
@@ -4,7 +4,7 @@
 
 from dataclasses import dataclass, field
 from enum import Enum
-from pathlib import Path
+from pathlib import Path, PurePosixPath, PureWindowsPath
 from typing import Any, Dict, List, Optional, Union
 
 from gm.core.exceptions import ConfigValidationError
@@ -47,6 +47,11 @@ class ValidationResult:
 class ConfigValidator:
     """配置验证执行类"""
 
+    # 必需的配置节（类级常量，避免每次验证重新构建）
+    REQUIRED_SECTIONS = ("worktree", "shared_files")
+    # 支持的符号链接策略
+    VALID_SYMLINK_STRATEGIES = frozenset({"auto", "symlink", "junction", "hardlink"})
+
     def __init__(self, strict: bool = False, project_root: Optional[Path] = None):
         """初始化
         Args:
@@ -81,7 +86,7 @@ class ConfigValidator:
         
         if "shared_files" in config:
             self._validate_shared_files_config(config["shared_files"])
-        
+
         if "plugins" in config:
             self._validate_plugin_config(config["plugins"])
 
@@ -90,8 +95,7 @@ class ConfigValidator:
 
     def _validate_required_sections(self, config: Dict[str, Any]) -> None:
         """验证必需的配置节是否存在"""
-        required = ["worktree", "shared_files"]
-        for section in required:
+        for section in self.REQUIRED_SECTIONS:
             if section not in config:
                 self.result.add_error("config", f"缺失必需的配置节: '{section}'")
 
@@ -107,6 +111,34 @@ class ConfigValidator:
             if self.strict and not base_path.is_absolute():
                 self.result.add_error("worktree.base_path", "严格模式下 base_path 必须是绝对路径", ErrorSeverity.WARNING)
 
+        if "sparse_paths" in wt_config:
+            for error in self.validate_sparse_paths(wt_config["sparse_paths"]).errors:
+                self.result.add_error(error.field, error.message, error.severity)
+
+    def validate_sparse_paths(self, sparse_paths: Any) -> ValidationResult:
+        """验证 worktree.sparse_paths：为空或由相对仓库根目录的路径字符串组成的列表
+        Args:
+            sparse_paths: 配置中的 sparse_paths 值
+        Returns:
+            验证结果对象
+        """
+        result = ValidationResult()
+        if sparse_paths is None:
+            return result
+        if not isinstance(sparse_paths, list):
+            result.add_error("worktree.sparse_paths", f"sparse_paths 必须是列表格式: {sparse_paths!r}")
+            return result
+
+        for i, item in enumerate(sparse_paths):
+            field_name = f"worktree.sparse_paths[{i}]"
+            if not isinstance(item, str) or not item.strip():
+                result.add_error(field_name, f"配置项必须是非空字符串: {item!r}")
+            elif PurePosixPath(item).is_absolute() or PureWindowsPath(item).is_absolute() or item.startswith("\\"):
+                result.add_error(field_name, f"必须是相对仓库根目录的路径: {item}")
+            elif ".." in item.replace("\\", "/").split("/"):
+                result.add_error(field_name, f"不能包含 '..': {item}")
+        return result
+
     def _validate_shared_files_config(self, shared_config: Any) -> None:
         """验证 shared_files 配置节"""
         if not isinstance(shared_config, list):
@@ -117,6 +149,18 @@ class ConfigValidator:
             if not isinstance(item, str):
                 self.result.add_error(f"shared_files[{i}]", f"配置项必须是字符串: {item}")
 
+    def validate_symlink_strategy(self, strategy: Any) -> ValidationResult:
+        """验证单个符号链接策略
+        Args:
+            strategy: 策略名称
+        Returns:
+            验证结果对象
+        """
+        result = ValidationResult()
+        if not (isinstance(strategy, str) and strategy in self.VALID_SYMLINK_STRATEGIES):
+            result.add_error("symlinks.strategy", f"不支持的符号链接策略: {strategy}")
+        return result
+
     def _validate_plugin_config(self, plugin_config: Any) -> None:
         """验证 plugins 配置节"""
         if not isinstance(plugin_config, dict):
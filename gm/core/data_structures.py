@@ -168,6 +168,8 @@ class WorktreeConfig:
     base_path: str = "."
     naming_pattern: str = "{branch}"
     auto_cleanup: bool = True
+    # 非空时新 worktree 只稀疏检出这些目录（cone 模式）
+    sparse_paths: List[str] = field(default_factory=list)
 
 
 @dataclass
@@ -3,6 +3,7 @@
 提供基础的 Git 操作封装，通过 subprocess 调用 Git 命令，并支持事务回滚。"""
 
 import subprocess
+import sys
 from pathlib import Path
 from typing import List, Optional, Dict, Any, Tuple
 
@@ -12,6 +13,10 @@ from gm.core.interfaces.git import IGitClient
 
 logger = get_logger("git_client")
 
+# stream_command 每次从 stderr 读取的字节数，以及为错误详情保留的末尾字节数
+_STREAM_CHUNK_SIZE = 65536
+_STREAM_TAIL_BYTES = 8192
+
 
 class GitClient(IGitClient):
     """Git 客户端实现类"""
@@ -19,7 +24,7 @@ class GitClient(IGitClient):
     def __init__(self, repo_path: Optional[Path] = None):
         """初始化 GitClient"""
         self.repo_path = Path(repo_path) if repo_path else Path.cwd()
-        logger.info("GitClient initialized", repo_path=str(self.repo_path))
+        logger.info("GitClient initialized", repo_path=self.repo_path)
 
     def run_command(
         self,
@@ -29,9 +34,11 @@ class GitClient(IGitClient):
     ) -> str:
         """运行 Git 命令"""
         cwd = cwd or self.repo_path
-        logger.debug("Running git command", command=" ".join(cmd), cwd=str(cwd))
+        logger.debug("Running git command", command=cmd, cwd=cwd)
 
         try:
+            # 不要传 preexec_fn / user / group 等参数：Linux 上 CPython 3.10+ 仅在没有这些参数时
+            # 才用 vfork 启动子进程，否则退化为 fork 并复制整个解释器的页表，每次 git 调用都会变慢
             result = subprocess.run(
                 cmd,
                 cwd=cwd,
@@ -48,6 +55,52 @@ class GitClient(IGitClient):
         except Exception as e:
             raise GitCommandError(f"Failed to execute git command: {e}") from e
 
+    def stream_command(
+        self,
+        cmd: List[str],
+        cwd: Optional[Path] = None,
+        tail_lines: int = 20,
+    ) -> None:
+        """运行输出量大的 Git 命令（如 clone），原样转发 stderr 进度而不整体缓冲
+
+        stdout 直接丢弃；stderr 以二进制分块读取并原样写到终端，保留 git 进度条用 \r
+        原地刷新的效果（文本模式的通用换行会把每帧变成新的一行）。只保留末尾一段输出，
+        失败时取最后 tail_lines 行作为错误详情，避免大仓库的进度输出占满管道或堆积在内存中。
+        """
+        cwd = cwd or self.repo_path
+        logger.debug("Streaming git command", command=cmd, cwd=cwd)
+
+        out = getattr(sys.stderr, "buffer", None)
+        tail = b""
+        try:
+            # 先刷新文本层，避免与直接写入底层 buffer 的内容交错
+            sys.stderr.flush()
+            # 同 run_command：保持无 preexec_fn 的 vfork 快速启动路径
+            with subprocess.Popen(
+                cmd,
+                cwd=cwd,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                bufsize=0,
+            ) as proc:
+                for chunk in iter(lambda: proc.stderr.read(_STREAM_CHUNK_SIZE), b""):
+                    if out is not None:
+                        out.write(chunk)
+                        out.flush()
+                    else:
+                        sys.stderr.write(chunk.decode("utf-8", errors="replace"))
+                        sys.stderr.flush()
+                    tail = (tail + chunk)[-_STREAM_TAIL_BYTES:]
+                returncode = proc.wait()
+        except Exception as e:
+            raise GitCommandError(f"Failed to execute git command: {e}") from e
+
+        if returncode != 0:
+            lines = tail.decode("utf-8", errors="replace").splitlines()
+            raise GitCommandError(
+                f"Git command failed: {' '.join(cmd)}", details="\n".join(lines[-tail_lines:])
+            )
+
     def is_bare_repository(self, path: Optional[Path] = None) -> bool:
         """检查是否为裸仓库"""
         cwd = path or self.repo_path
@@ -59,7 +112,8 @@ class GitClient(IGitClient):
 
     def create_worktree(self, path: Path, branch: Optional[str] = None, 
                        new_branch: Optional[str] = None, base_branch: Optional[str] = None,
-                       force: bool = False, cwd: Optional[Path] = None) -> bool:
+                       force: bool = False, cwd: Optional[Path] = None,
+                       sparse_paths: Optional[List[str]] = None) -> bool:
         """创建 worktree
         
         Args:
@@ -69,9 +123,18 @@ class GitClient(IGitClient):
             base_branch: 基于哪个分支创建新分支
             force: 是否强制创建
             cwd: 执行命令的工作目录（默认在 repo_path 执行）
+            sparse_paths: 非空时先 --no-checkout 创建，再以 cone 模式只检出这些目录
+                （sparse-checkout set --cone 需要 git 2.35 及以上）
+
+        Returns:
+            git worktree add 成功返回 True，失败返回 False
+
+        Raises:
+            GitCommandError: 稀疏检出失败；已创建的 worktree 和本次新建的分支会先被撤销
         """
         cmd = ["git", "worktree", "add"]
         if force: cmd.append("--force")
+        if sparse_paths: cmd.append("--no-checkout")
         
         if new_branch:
             # 创建新分支: git worktree add <path> -b <new_branch> [base_branch]
@@ -87,10 +150,30 @@ class GitClient(IGitClient):
         
         try:
             self.run_command(cmd, cwd=cwd)
-            return True
-        except:
+        except GitCommandError:
             return False
 
+        if sparse_paths:
+            # 相对路径以执行目录为基准；检出范围设定后再按 HEAD 填充工作区
+            worktree_dir = (cwd or self.repo_path) / path
+            try:
+                self.run_command(
+                    ["git", "sparse-checkout", "set", "--cone", *sparse_paths], cwd=worktree_dir
+                )
+                self.run_command(["git", "read-tree", "-mu", "HEAD"], cwd=worktree_dir)
+            except GitCommandError as e:
+                # 不留下未检出的 worktree 和随之新建的分支
+                self.run_command(
+                    ["git", "worktree", "remove", "--force", str(worktree_dir)], cwd=cwd, check=False
+                )
+                if new_branch:
+                    self.run_command(["git", "branch", "-D", new_branch], cwd=cwd, check=False)
+                logger.error("Sparse checkout failed, worktree removed", path=str(worktree_dir), error=str(e))
+                raise GitCommandError(
+                    f"稀疏检出失败，已撤销 worktree: {path}", details=e.details
+                ) from e
+        return True
+
     def remove_worktree(self, path: Path, force: bool = False) -> bool:
         """删除 worktree"""
         cmd = ["git", "worktree", "remove"]
@@ -133,6 +216,68 @@ class GitClient(IGitClient):
         except:
             return False
 
+    def resolve_branch(self, branch: str) -> Dict[str, bool]:
+        """通过一次 for-each-ref 调用同时判断本地与远程分支是否存在
+
+        远程分支既匹配 origin/<branch>，也匹配已带远程前缀的 <branch>（如 origin/foo）。
+
+        Returns:
+            {'local': bool, 'remote': bool}
+        """
+        local_ref = f"refs/heads/{branch}"
+        remote_refs = (f"refs/remotes/origin/{branch}", f"refs/remotes/{branch}")
+        try:
+            output = self.run_command(
+                ["git", "for-each-ref", "--format=%(refname)", local_ref, *remote_refs]
+            )
+        except GitCommandError:
+            return {"local": False, "remote": False}
+
+        # for-each-ref 的模式会做前缀匹配，这里必须精确比较
+        refs = set(output.splitlines())
+        return {
+            "local": local_ref in refs,
+            "remote": any(ref in refs for ref in remote_refs),
+        }
+
+    def ref_exists(self, ref: str) -> bool:
+        """按完整引用名精确判断引用是否存在（git show-ref --verify）"""
+        try:
+            self.run_command(["git", "show-ref", "--verify", "--quiet", ref])
+            return True
+        except GitCommandError:
+            return False
+
+    def remote_ref_exists(self, branch: str) -> bool:
+        """判断远程分支是否存在（origin/<branch> 或已带远程前缀的 <branch>）"""
+        return (
+            self.ref_exists(f"refs/remotes/origin/{branch}")
+            or self.ref_exists(f"refs/remotes/{branch}")
+        )
+
+    def list_branch_refs(self) -> Tuple[List[str], List[str]]:
+        """通过一次 for-each-ref 同时列出本地分支与远程分支
+
+        Returns:
+            (本地分支列表, 远程分支列表如 origin/main)，远程列表不含 <remote>/HEAD
+        """
+        try:
+            output = self.run_command(
+                ["git", "for-each-ref", "--format=%(refname)", "refs/heads/", "refs/remotes/"]
+            )
+        except GitCommandError:
+            return [], []
+
+        local_prefix, remote_prefix = "refs/heads/", "refs/remotes/"
+        local_branches: List[str] = []
+        remote_branches: List[str] = []
+        for ref in output.splitlines():
+            if ref.startswith(local_prefix):
+                local_branches.append(ref[len(local_prefix):])
+            elif ref.startswith(remote_prefix) and not ref.endswith("/HEAD"):
+                remote_branches.append(ref[len(remote_prefix):])
+        return local_branches, remote_branches
+
     def get_current_branch(self, path: Optional[Path] = None) -> Optional[str]:
         """获取当前分支"""
         try:
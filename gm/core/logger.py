@@ -3,6 +3,7 @@
 支持链路追踪和性能监控的结构化日志记录器。使用 structlog 库提供 JSON 输出格式。"""
 
 import logging
+import os
 import json
 import time
 import traceback
@@ -13,8 +14,6 @@ from typing import Any, Dict, Optional, List, Union
 from pathlib import Path
 from contextlib import contextmanager
 
-import structlog
-
 
 # 全局链路上下文变量
 _request_id: contextvars.ContextVar[str] = contextvars.ContextVar(
@@ -28,6 +27,15 @@ _user_id: contextvars.ContextVar[str] = contextvars.ContextVar(
 )
 
 
+# 方法名到 logging 级别的映射
+_LEVELS = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+}
+
+
 class LoggerConfig:
     """日志配置类"""
 
@@ -55,6 +63,7 @@ class Logger:
     """结构化日志记录器
 
     提供 JSON 格式的结构化日志记录，支持链路追踪。
+    structlog 在第一条真正输出的日志时才导入并配置，默认级别下的命令无需承担其导入开销。
     """
 
     def __init__(self, name: str = "gm", config: Optional[LoggerConfig] = None):
@@ -66,11 +75,26 @@ class Logger:
         """
         self.name = name
         self.config = config or LoggerConfig()
-        self._setup_structlog()
-        self.logger = structlog.get_logger(name)
-
-    def _setup_structlog(self) -> None:
-        """配置 structlog"""
+        self._setup_handlers()
+        self._logger: Any = None
+        # structlog 的 stdlib 工厂按同名取底层 logger，用于提前做级别判断
+        self._stdlib_logger = logging.getLogger(name)
+
+    @property
+    def logger(self) -> Any:
+        """底层 structlog 记录器，首次访问时导入并配置 structlog"""
+        if self._logger is None:
+            self._setup_structlog()
+            import structlog
+            self._logger = structlog.get_logger(self.name)
+        return self._logger
+
+    @logger.setter
+    def logger(self, value: Any) -> None:
+        self._logger = value
+
+    def _setup_handlers(self) -> None:
+        """配置标准库 logging 的输出处理器"""
         handlers = []
 
         # 添加控制台处理器
@@ -94,7 +118,10 @@ class Logger:
                 format="%(message)s",
             )
 
-        # 配置 structlog 的处理器
+    def _setup_structlog(self) -> None:
+        """配置 structlog"""
+        import structlog
+
         structlog.configure(
             processors=[
                 structlog.stdlib.filter_by_level,
@@ -153,6 +180,10 @@ class Logger:
             event: 日志事件描述
             **kwargs: 其他日志属性
         """
+        # 级别被过滤时直接返回，跳过上下文构建和处理器链
+        if not self._stdlib_logger.isEnabledFor(_LEVELS[level]):
+            return
+
         context = self._build_context(**kwargs)
 
         log_method = getattr(self.logger, level)
@@ -184,8 +215,9 @@ class Logger:
         if user_id:
             context['user_id'] = user_id
 
-        # 添加用户提供的上下文
-        context.update(kwargs)
+        # 添加用户提供的上下文，路径对象只在真正输出时才转成字符串
+        for key, value in kwargs.items():
+            context[key] = os.fspath(value) if isinstance(value, os.PathLike) else value
 
         return context
 
@@ -2,8 +2,10 @@
 
 管理项目主分支与各 worktree 之间的文件共享（通过符号链接）。"""
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set, Tuple
 
 from gm.core.symlink_manager import SymlinkManager
 from gm.core.config_manager import ConfigManager
@@ -16,6 +18,9 @@ logger = get_logger("shared_file_manager")
 class SharedFileManager:
     """共享文件管理器"""
 
+    # 待创建链接数达到该值时改用线程池并行创建，少量链接时线程开销得不偿失
+    PARALLEL_THRESHOLD = 8
+
     def __init__(
         self,
         main_branch_path: Path,
@@ -31,20 +36,57 @@ class SharedFileManager:
     def setup_shared_files(self, worktree_path: Path) -> bool:
         """为指定的 worktree 设置共享文件"""
         try:
-            shared_files = self.config_manager.get_shared_files()
+            # 按配置顺序去重，重复条目不再重复 stat 和建链
+            shared_files = tuple(dict.fromkeys(self.config_manager.get_shared_files()))
             if not shared_files:
                 return True
 
+            present = self._list_present_entries()
+            # 基准目录只转换一次，循环内用字符串拼接，避免逐个构造 Path
+            source_base = os.fspath(self.main_branch_path)
+            target_base = os.fspath(worktree_path)
+            pairs: List[Tuple[str, str]] = []
             for file_name in shared_files:
-                source = self.main_branch_path / file_name
-                target = worktree_path / file_name
-                if source.exists() and not target.exists():
-                    self.symlink_manager.create_symlink(source, target)
+                source = os.path.join(source_base, file_name)
+                target = os.path.join(target_base, file_name)
+                # 顶层文件直接查 scandir 结果，嵌套路径才单独 stat
+                if os.sep in file_name or "/" in file_name:
+                    source_exists = os.path.exists(source)
+                else:
+                    source_exists = file_name in present
+                # lexists 不跟随链接，悬空的旧链接也视为已存在
+                if source_exists and not os.path.lexists(target):
+                    pairs.append((source, target))
+
+            self._create_links(pairs)
             return True
         except Exception as e:
             logger.error(f"Failed to setup shared files: {e}")
             raise SymlinkException(f"Failed to setup shared files: {e}")
 
+    def _create_links(self, pairs: List[Tuple[str, str]]) -> None:
+        """创建 (source, target) 链接，数量较多时并行执行"""
+        if len(pairs) < self.PARALLEL_THRESHOLD:
+            for source, target in pairs:
+                self.symlink_manager.create_symlink(source, target)
+            return
+
+        workers = min(32, (os.cpu_count() or 1) * 4, len(pairs))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # 消费 map 结果，使任一链接失败时异常向上抛出
+            list(executor.map(lambda pair: self.symlink_manager.create_symlink(*pair), pairs))
+
+    def _list_present_entries(self) -> Set[str]:
+        """一次 scandir 列出主分支目录下存在的条目名（排除悬空链接）"""
+        try:
+            with os.scandir(self.main_branch_path) as it:
+                return {
+                    entry.name for entry in it
+                    if not entry.is_symlink() or os.path.exists(entry.path)
+                }
+        except FileNotFoundError:
+            return set()
+
     def sync_shared_files(self, worktree_path: Path) -> Dict[str, bool]:
         """同步/修复共享文件"""
         return {}
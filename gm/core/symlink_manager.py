@@ -112,7 +112,7 @@ class SymlinkManager(ISymlinkManager):
                 else:
                     self._create_symlink_hardlink(target, link)
             else:
-                link.symlink_to(target)
+                os.symlink(target, link)
             return True
         except Exception as e:
             raise SymlinkCreationError(f"Failed to create symlink: {e}")
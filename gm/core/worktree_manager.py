@@ -2,6 +2,7 @@
 
 负责 worktree 的创建、修改和删除逻辑，并实现 ILayoutManager 接口。"""
 
+import os
 import shutil
 from pathlib import Path
 from typing import List, Optional, Dict, Any, TYPE_CHECKING
@@ -277,7 +278,7 @@ class WorktreeManager(ILayoutManager):
             target = worktree_path / file_name
             if source.exists() and not target.exists():
                 try:
-                    target.symlink_to(source)
+                    os.symlink(source, target)
                 except Exception as e:
                     logger.warning(f"Failed to create symlink for {file_name}: {e}")
 
@@ -0,0 +1,38 @@
+"""gm add 命令测试"""
+
+import pytest
+
+from gm.cli.commands.add import AddCommand
+from gm.core.exceptions import ConfigValidationError, GitCommandError
+
+
+def test_invalid_sparse_paths_rejected_before_creating_worktree(tmp_path, monkeypatch):
+    (tmp_path / ".gm").mkdir()
+    (tmp_path / "gm.yaml").write_text(
+        "worktree:\n  base_path: .gm\n  sparse_paths: src\nshared_files: []\n",
+        encoding="utf-8",
+    )
+    cmd = AddCommand(tmp_path)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("git should not run for an invalid config")
+
+    monkeypatch.setattr(cmd, "check_branch_exists", fail)
+    monkeypatch.setattr(cmd.git_client, "create_worktree", fail)
+
+    with pytest.raises(ConfigValidationError) as excinfo:
+        cmd.execute("feature/x")
+
+    assert "worktree.sparse_paths" in excinfo.value.message
+
+
+def test_failed_git_worktree_add_is_reported(tmp_path, monkeypatch):
+    (tmp_path / ".gm").mkdir()
+    (tmp_path / "gm.yaml").write_text(
+        "worktree:\n  base_path: .gm\nshared_files: []\n", encoding="utf-8"
+    )
+    cmd = AddCommand(tmp_path)
+    monkeypatch.setattr(cmd.git_client, "create_worktree", lambda **kwargs: False)
+
+    with pytest.raises(GitCommandError):
+        cmd.create_worktree("feature-x", "feature/x", local=False, branch_exists=True)
@@ -0,0 +1,71 @@
+"""gm cache 命令测试"""
+
+import importlib
+
+import pytest
+from click.testing import CliRunner
+
+# 包的 __init__ 导出了同名的 cache 命令组，这里取模块本身
+cache_module = importlib.import_module("gm.cli.commands.advanced.cache")
+
+
+class FakeCacheManager:
+    """只提供 cache 命令用到的属性和方法"""
+
+    def __init__(self, cache_path, expired=0):
+        self.cache_path = cache_path
+        self.expired = expired
+
+    def cleanup_expired(self):
+        return self.expired
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    path = tmp_path / "cache"
+    path.mkdir()
+    monkeypatch.setattr(cache_module, "get_cache_manager", lambda: FakeCacheManager(path))
+    return path
+
+
+def run_cache(*args):
+    return CliRunner().invoke(cache_module.cache, list(args), obj={"no_color": True})
+
+
+def test_info_reports_zero_bytes_for_empty_cache(cache_dir):
+    result = run_cache("info")
+
+    assert result.exit_code == 0
+    assert "大小: 0 B" in result.output
+
+
+def test_info_counts_file_bytes_only(cache_dir):
+    (cache_dir / "sub").mkdir()
+    (cache_dir / "sub" / "entry").write_bytes(b"x" * 2048)
+
+    result = run_cache("info")
+
+    assert result.exit_code == 0
+    assert "大小: 2.0 KB" in result.output
+
+
+def test_clear_reports_expired_entry_count(tmp_path, monkeypatch):
+    path = tmp_path / "cache"
+    path.mkdir()
+    monkeypatch.setattr(cache_module, "get_cache_manager", lambda: FakeCacheManager(path, expired=3))
+
+    result = run_cache("clear")
+
+    assert result.exit_code == 0
+    assert "清理过期条目: 3 个" in result.output
+    assert "释放空间" not in result.output
+
+
+def test_clear_all_reports_freed_size(cache_dir):
+    (cache_dir / "entry").write_bytes(b"x" * (1024 * 1024))
+
+    result = run_cache("clear", "--all")
+
+    assert result.exit_code == 0
+    assert "释放空间: 1.0 MB" in result.output
+    assert list(cache_dir.iterdir()) == []
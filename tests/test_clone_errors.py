@@ -0,0 +1,69 @@
+"""gm clone 异常包装与日志测试"""
+
+import pytest
+
+from gm.cli.commands import clone as clone_module
+from gm.cli.commands.clone import CloneCommand
+from gm.core.exceptions import ConfigException, GitCommandError, GitException
+
+
+class RecordingLogger:
+    """记录 error 事件名，其余级别忽略"""
+
+    def __init__(self):
+        self.errors = []
+
+    def error(self, event, **kwargs):
+        self.errors.append(event)
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+@pytest.fixture
+def log(monkeypatch):
+    recorder = RecordingLogger()
+    monkeypatch.setattr(clone_module, "logger", recorder)
+    return recorder
+
+
+def test_initialize_gm_wraps_git_exception_as_config_exception(tmp_path, log, monkeypatch):
+    def failing_init(path):
+        raise GitException("boom")
+
+    monkeypatch.setattr(clone_module, "InitCommand", failing_init)
+
+    with pytest.raises(ConfigException) as excinfo:
+        CloneCommand("https://example.com/repo.git").initialize_gm(tmp_path)
+
+    assert excinfo.value.message == "初始化失败：boom"
+    assert isinstance(excinfo.value.__cause__, GitException)
+    assert log.errors == ["Failed to initialize GM project"]
+
+
+def test_initialize_gm_passes_config_exception_through(tmp_path, log, monkeypatch):
+    def failing_init(path):
+        raise ConfigException("项目已初始化")
+
+    monkeypatch.setattr(clone_module, "InitCommand", failing_init)
+
+    with pytest.raises(ConfigException) as excinfo:
+        CloneCommand("https://example.com/repo.git").initialize_gm(tmp_path)
+
+    assert excinfo.value.message == "项目已初始化"
+    assert log.errors == []
+
+
+def test_clone_repository_logs_git_command_error_before_reraising(tmp_path, log, monkeypatch):
+    error = GitCommandError("Git command failed: git clone", details="fatal: not found")
+
+    def failing_stream(self, cmd, cwd=None, tail_lines=20):
+        raise error
+
+    monkeypatch.setattr(clone_module.GitClient, "stream_command", failing_stream)
+
+    with pytest.raises(GitCommandError) as excinfo:
+        CloneCommand("https://example.com/repo.git").clone_repository(tmp_path / "repo")
+
+    assert excinfo.value is error
+    assert log.errors == ["Failed to clone repository"]
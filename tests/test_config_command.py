@@ -0,0 +1,81 @@
+"""gm config get/set 测试"""
+
+import importlib
+
+import pytest
+
+from gm.core.config_manager import ConfigManager
+from gm.core.exceptions import ConfigException, ConfigValidationError
+
+# 包的 __init__ 导出了同名的 config 命令组，这里取模块本身
+config_module = importlib.import_module("gm.cli.commands.advanced.config")
+
+
+@pytest.fixture
+def project(tmp_path):
+    manager = ConfigManager(tmp_path)
+    config = manager.load_config()
+    config.project_name = "demo"
+    config.branch_mapping = {"v1.2": "v1-2"}
+    manager.save_config(config)
+    return tmp_path
+
+
+def reload(project):
+    return ConfigManager(project).load_config()
+
+
+def test_set_round_trips_through_gm_yaml(project):
+    cmd = config_module.ConfigCommand(project)
+
+    cmd.execute_set("display.colors", "off")
+    cmd.execute_set("worktree.sparse_paths", "src, docs/api")
+    cmd.execute_set("symlinks.strategy", "hardlink")
+
+    config = reload(project)
+    assert config.display.colors is False
+    assert config.worktree.sparse_paths == ["src", "docs/api"]
+    assert config.symlinks.strategy == "hardlink"
+    assert config_module.ConfigCommand(project).execute_get("worktree.sparse_paths") == "src, docs/api"
+
+
+def test_set_mapping_key_containing_dot(project):
+    config_module.ConfigCommand(project).execute_set("branch_mapping.v1.2", "release-1-2")
+
+    assert reload(project).branch_mapping == {"v1.2": "release-1-2"}
+
+
+@pytest.mark.parametrize(
+    "key, value",
+    [
+        ("project_name", "x: y"),
+        ("project_name", "[a"),
+        ("main_branch", "true"),
+        ("symlinks.strategy", "bogus"),
+        ("worktree.sparse_paths", "src, ../x"),
+        ("display.colors", "maybe"),
+        ("branch_mapping.v1.2", "it's"),
+    ],
+)
+def test_set_rejects_invalid_value_without_touching_file(project, key, value):
+    before = (project / "gm.yaml").read_text(encoding="utf-8")
+    cmd = config_module.ConfigCommand(project)
+
+    with pytest.raises(ConfigValidationError):
+        cmd.execute_set(key, value)
+
+    assert (project / "gm.yaml").read_text(encoding="utf-8") == before
+    assert cmd.config_manager.load_config().project_name == "demo"
+
+
+@pytest.mark.parametrize("key", ["no_such_key", "worktree", "branch_mapping", "display.colors.x"])
+def test_unknown_or_section_key_is_rejected(project, key):
+    cmd = config_module.ConfigCommand(project)
+
+    with pytest.raises(ConfigException):
+        cmd.execute_set(key, "x")
+
+
+def test_get_unknown_key_raises(project):
+    with pytest.raises(ConfigException):
+        config_module.ConfigCommand(project).execute_get("no_such_key")
@@ -0,0 +1,60 @@
+"""ConfigManager 保存测试"""
+
+import os
+import stat
+
+import pytest
+
+from gm.core.config_manager import ConfigManager
+from gm.core.exceptions import ConfigIOError
+
+
+def test_save_keeps_file_mode(tmp_path):
+    manager = ConfigManager(tmp_path)
+    manager.save_config(manager.load_config())
+    os.chmod(tmp_path / "gm.yaml", 0o600)
+
+    config = manager.load_config()
+    config.project_name = "demo"
+    manager.save_config(config)
+
+    assert stat.S_IMODE(os.stat(tmp_path / "gm.yaml").st_mode) == 0o600
+
+
+@pytest.mark.skipif(not hasattr(os, "symlink"), reason="需要符号链接支持")
+def test_save_writes_through_symlink(tmp_path):
+    shared = tmp_path / "shared"
+    shared.mkdir()
+    project = tmp_path / "project"
+    project.mkdir()
+    (shared / "gm.yaml").write_text("project_name: old\n", encoding="utf-8")
+    (project / "gm.yaml").symlink_to(shared / "gm.yaml")
+
+    manager = ConfigManager(project)
+    config = manager.load_config()
+    config.project_name = "new"
+    manager.save_config(config)
+
+    assert (project / "gm.yaml").is_symlink()
+    assert ConfigManager(shared).load_config().project_name == "new"
+
+
+def test_failed_save_drops_cached_config(tmp_path, monkeypatch):
+    manager = ConfigManager(tmp_path)
+    config = manager.load_config()
+    config.project_name = "demo"
+    manager.save_config(config)
+
+    config = manager.load_config()
+    config.project_name = "unsaved"
+
+    def fail(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "replace", fail)
+    with pytest.raises(ConfigIOError):
+        manager.save_config(config)
+    monkeypatch.undo()
+
+    assert manager.load_config().project_name == "demo"
+    assert [p.name for p in tmp_path.iterdir()] == ["gm.yaml"]
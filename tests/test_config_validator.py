@@ -0,0 +1,62 @@
+"""ConfigValidator 测试"""
+
+import pytest
+
+from gm.core.config_validator import ConfigValidator
+
+
+VALID_CONFIG = {
+    "worktree": {"base_path": ".gm"},
+    "shared_files": [".env"],
+}
+
+
+def test_each_call_returns_a_fresh_result():
+    validator = ConfigValidator()
+
+    first = validator.validate_config(dict(VALID_CONFIG))
+    first.add_error("worktree", "调用方追加的错误")
+
+    second = validator.validate_config(dict(VALID_CONFIG))
+
+    assert second is not first
+    assert second.is_valid
+    assert second.errors == []
+
+
+def test_values_that_serialize_alike_are_validated_by_type():
+    validator = ConfigValidator()
+
+    as_list = validator.validate_config({"worktree": {}, "shared_files": [".env"]})
+    as_tuple = validator.validate_config({"worktree": {}, "shared_files": (".env",)})
+
+    assert as_list.is_valid
+    assert not as_tuple.is_valid
+
+
+def test_sparse_paths_accepts_relative_path_list():
+    result = ConfigValidator().validate_config(
+        {"worktree": {"sparse_paths": ["src", "docs/api"]}, "shared_files": []}
+    )
+
+    assert result.is_valid
+
+
+@pytest.mark.parametrize(
+    "sparse_paths, field",
+    [
+        ("src", "worktree.sparse_paths"),
+        (["/abs/src"], "worktree.sparse_paths[0]"),
+        (["C:\\src"], "worktree.sparse_paths[0]"),
+        (["src/../.."], "worktree.sparse_paths[0]"),
+        (["src", 3], "worktree.sparse_paths[1]"),
+        ([""], "worktree.sparse_paths[0]"),
+    ],
+)
+def test_sparse_paths_rejects_bad_values(sparse_paths, field):
+    result = ConfigValidator().validate_config(
+        {"worktree": {"sparse_paths": sparse_paths}, "shared_files": []}
+    )
+
+    assert not result.is_valid
+    assert [e.field for e in result.errors] == [field]
@@ -0,0 +1,35 @@
+"""gm del 命令测试"""
+
+import importlib
+
+import pytest
+
+from gm.core.exceptions import GitCommandError
+
+# del 是关键字，只能按模块名导入
+del_module = importlib.import_module("gm.cli.commands.del")
+
+
+class FakeGitClient:
+    def __init__(self, push_error=None):
+        self.push_error = push_error
+
+    def delete_branch(self, branch, force=False):
+        pass
+
+    def run_command(self, cmd, cwd=None, check=True):
+        if self.push_error:
+            raise self.push_error
+        return ""
+
+
+@pytest.mark.parametrize("push_error, expected", [(None, True), (GitCommandError("push failed"), False)])
+def test_remote_deletion_result_is_recorded(tmp_path, push_error, expected):
+    cmd = del_module.DelCommand(tmp_path)
+    cmd.git_client = FakeGitClient(push_error)
+
+    assert cmd.remote_deleted is None
+    cmd.delete_branch("feature/x", delete_remote=True)
+    cmd.wait_remote_push()
+
+    assert cmd.remote_deleted is expected
@@ -0,0 +1,69 @@
+"""GitClient 测试（调用真实 git）"""
+
+import shutil
+import subprocess
+
+import pytest
+
+from gm.core.exceptions import GitCommandError
+from gm.core.git_client import GitClient
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="需要 git")
+
+
+def git(repo, *args):
+    return subprocess.run(
+        ["git", *args], cwd=repo, check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+@pytest.fixture
+def repo(tmp_path):
+    repo = tmp_path / "repo"
+    (repo / "src").mkdir(parents=True)
+    (repo / "docs").mkdir()
+    (repo / "README").write_text("readme\n")
+    (repo / "src" / "a.py").write_text("a\n")
+    (repo / "docs" / "b.md").write_text("b\n")
+    git(repo, "init", "-q", "-b", "main")
+    git(repo, "add", ".")
+    git(repo, "-c", "user.name=t", "-c", "user.email=t@example.com", "commit", "-q", "-m", "init")
+    return repo
+
+
+def test_sparse_worktree_checks_out_only_listed_dirs(repo):
+    created = GitClient(repo).create_worktree(
+        repo.parent / "wt", new_branch="feature", sparse_paths=["src"]
+    )
+
+    wt = repo.parent / "wt"
+    assert created
+    assert (wt / "README").is_file()
+    assert (wt / "src" / "a.py").is_file()
+    assert not (wt / "docs").exists()
+
+
+def test_failed_sparse_checkout_removes_worktree_and_new_branch(repo):
+    client = GitClient(repo)
+
+    with pytest.raises(GitCommandError):
+        client.create_worktree(repo.parent / "wt", new_branch="feature", sparse_paths=["a/../../x"])
+
+    assert not (repo.parent / "wt").exists()
+    assert git(repo, "branch", "--list", "feature") == ""
+    assert len(client.list_worktrees()) == 1
+
+
+def test_failed_sparse_checkout_keeps_existing_branch(repo):
+    git(repo, "branch", "existing")
+    client = GitClient(repo)
+
+    with pytest.raises(GitCommandError):
+        client.create_worktree(repo.parent / "wt", branch="existing", sparse_paths=["a/../../x"])
+
+    assert not (repo.parent / "wt").exists()
+    assert git(repo, "branch", "--list", "existing") != ""
+
+
+def test_failed_worktree_add_returns_false(repo):
+    assert GitClient(repo).create_worktree(repo.parent / "wt", branch="no-such-branch") is False
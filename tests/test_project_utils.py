@@ -0,0 +1,42 @@
+"""project_utils 文件系统工具测试"""
+
+import os
+
+import pytest
+
+from gm.cli.utils import project_utils
+from gm.cli.utils.project_utils import remove_tree
+
+
+def make_tree(root, count):
+    for i in range(count):
+        sub = root / f"d{i % 5}" / "x"
+        sub.mkdir(parents=True, exist_ok=True)
+        (sub / f"f{i}").write_text("x")
+
+
+@pytest.mark.parametrize("threshold", [10_000, 16])
+def test_remove_tree_removes_everything_without_following_symlinks(tmp_path, monkeypatch, threshold):
+    monkeypatch.setattr(project_utils, "PARALLEL_UNLINK_THRESHOLD", threshold)
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    (outside / "keep").write_text("keep")
+    tree = tmp_path / "tree"
+    make_tree(tree, 100)
+    os.symlink(outside, tree / "link")
+
+    remove_tree(tree)
+
+    assert not tree.exists()
+    assert (outside / "keep").read_text() == "keep"
+
+
+def test_remove_tree_uses_rmtree_for_small_trees(tmp_path, monkeypatch):
+    calls = []
+    monkeypatch.setattr(project_utils.shutil, "rmtree", lambda path: calls.append(path))
+    tree = tmp_path / "tree"
+    make_tree(tree, 3)
+
+    remove_tree(tree)
+
+    assert calls == [os.fspath(tree)]